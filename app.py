@@ -8,6 +8,7 @@ import os
 import json
 import threading
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from octav_client import OctavClient
 from delta_neutral_analyzer import DeltaNeutralAnalyzer
@@ -43,6 +44,29 @@ st.markdown("""
 # Initialize config manager
 config_mgr = ConfigManager()
 
+@st.cache_resource
+def get_octav_client(api_key):
+    """Get a shared Octav.fi client (one HTTP connection pool per API key)"""
+    return OctavClient(api_key)
+
+@st.cache_resource(max_entries=32)
+def get_analyzer(hedge_value_threshold_pct, total_capital):
+    """Get a shared delta neutral analyzer (stateless between calls)"""
+    return DeltaNeutralAnalyzer(
+        hedge_value_threshold_pct=hedge_value_threshold_pct,
+        total_capital=total_capital
+    )
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def compute_suggestions(lp_items, short_items, price_items, hedge_value_threshold_pct, total_capital):
+    """Compare LP and short balances (given as sorted item tuples)
+
+    Cached, so reruns that don't change the balances or the threshold skip
+    the comparison; each hit returns a fresh copy, safe to mutate.
+    """
+    analyzer = get_analyzer(hedge_value_threshold_pct, total_capital)
+    return analyzer.compare_positions(dict(lp_items), dict(short_items), dict(price_items))
+
 # Helper function to get active wallet config in compatible format
 def get_active_config():
     """Get active wallet config in format compatible with old single-wallet code"""
@@ -51,6 +75,41 @@ def get_active_config():
         return None
     return wallet_config
 
+# Session keys holding the fetched portfolio and the positions derived from it
+PORTFOLIO_SESSION_KEYS = (
+    "portfolio_data", "lp_positions", "perp_positions",
+    "lp_balances", "short_balances", "token_prices", "hedge_tokens", "networth",
+    "fetched_at", "proof_table",
+)
+
+def store_portfolio_data(client, portfolio):
+    """Save a fetched portfolio and what the tabs derive from it in the session
+
+    Positions are extracted and balances aggregated/sorted once per fetch,
+    instead of on every rerun of every tab that shows them.
+    """
+    lp_positions = client.extract_lp_positions(portfolio)
+    perp_positions = client.extract_perp_positions(portfolio)
+    lp_balances = dict(sorted(OctavClient.aggregate_lp_balances(lp_positions).items()))
+    short_balances = dict(sorted(OctavClient.aggregate_short_balances(perp_positions).items()))
+    
+    st.session_state.portfolio_data = portfolio
+    st.session_state.networth = float(portfolio.get("networth") or 0)
+    st.session_state.lp_positions = lp_positions
+    st.session_state.perp_positions = perp_positions
+    st.session_state.lp_balances = lp_balances
+    st.session_state.short_balances = short_balances
+    st.session_state.token_prices = OctavClient.extract_token_prices(lp_positions)
+    st.session_state.hedge_tokens = sorted(lp_balances.keys() | short_balances.keys())
+    st.session_state.fetched_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Render artifacts built from the previous fetch
+    st.session_state.pop("proof_table", None)
+
+def clear_portfolio_data():
+    """Drop the fetched portfolio from the session (e.g. when the wallet changes)"""
+    for key in PORTFOLIO_SESSION_KEYS:
+        st.session_state.pop(key, None)
+
 def save_active_config(config_data):
     """Save active wallet config"""
     active_wallet_id = config_mgr.get_active_wallet_id()
@@ -61,6 +120,8 @@ def save_active_config(config_data):
 # Background sync thread
 def background_sync_worker():
     """Background thread that syncs data periodically"""
+    # Reused across iterations while the API key stays the same
+    client = None
     while True:
         try:
             config = get_active_config()
@@ -94,7 +155,8 @@ def background_sync_worker():
                 wallet_address = config.get("wallet_address")
                 
                 if api_key and wallet_address:
-                    client = OctavClient(api_key)
+                    if client is None or client.api_key != api_key:
+                        client = OctavClient(api_key)
                     
                     # First sync
                     portfolio = client.get_portfolio(wallet_address)
@@ -117,25 +179,14 @@ def background_sync_worker():
                             if any(proto.lower() in pos.protocol.lower() for proto in enabled_protocols)
                         ]
                         
-                        lp_balances = {}
-                        for pos in filtered_lp_positions:
-                            symbol = client.normalize_symbol(pos.token_symbol)
-                            lp_balances[symbol] = lp_balances.get(symbol, 0) + pos.balance
-                        
-                        short_balances = {}
-                        for pos in perp_positions:
-                            if pos.size < 0:
-                                symbol = client.normalize_symbol(pos.symbol)
-                                short_balances[symbol] = short_balances.get(symbol, 0) + abs(pos.size)
+                        lp_balances = OctavClient.aggregate_lp_balances(filtered_lp_positions)
+                        short_balances = OctavClient.aggregate_short_balances(perp_positions)
                         
                         networth = float(portfolio.get("networth", "0"))
                         hedge_value_threshold_pct = config.get("hedge_value_threshold_pct", 10.0)
                         
                         # Extract token prices from LP positions (normalize symbols using same method as balances)
-                        token_prices = {}
-                        for pos in lp_positions:
-                            symbol = client.normalize_symbol(pos.token_symbol)
-                            token_prices[symbol] = pos.price
+                        token_prices = OctavClient.extract_token_prices(lp_positions)
                         
                         analyzer = DeltaNeutralAnalyzer(
                             hedge_value_threshold_pct=hedge_value_threshold_pct,
@@ -143,9 +194,10 @@ def background_sync_worker():
                         )
                         suggestions = analyzer.compare_positions(lp_balances, short_balances, token_prices)
                         
-                        balanced = [s for s in suggestions if s.status == "balanced"]
-                        under_hedged = [s for s in suggestions if s.status == "under_hedged"]
-                        over_hedged = [s for s in suggestions if s.status == "over_hedged"]
+                        buckets = DeltaNeutralAnalyzer.group_by_status(suggestions)
+                        balanced = buckets["balanced"]
+                        under_hedged = buckets["under_hedged"]
+                        over_hedged = buckets["over_hedged"]
                         
                         summary = {
                             "networth": networth,
@@ -252,6 +304,723 @@ if 'keep_alive_started' not in st.session_state:
     keep_alive_thread.start()
     st.session_state.keep_alive_started = True
 
+# --- Tab bodies ---
+# Tabs with their own widgets run as fragments, so interacting with them
+# doesn't rerun the sidebar and every other tab
+
+@st.fragment
+def render_nav_tab():
+    """NAV tab; its inputs and buttons rerun only this fragment"""
+    st.header("📈 NAV (Net Asset Value)")
+    st.info("📊 Acompanhe o valor líquido do seu portfólio e a evolução da cotação, desconsiderando aportes e saques.")
+    
+    # Load NAV data
+    nav_snapshots = config_mgr.load_nav_snapshots()
+    share_transactions = config_mgr.load_share_transactions()
+    sync_history = config_mgr.load_history()  # Load sync history with NAV values
+    
+    # Calculate current NAV from portfolio data if available
+    current_nav = None
+    if 'portfolio_data' in st.session_state:
+        current_nav = st.session_state.networth or None
+    
+    # Calculate total shares
+    total_shares = config_mgr.get_total_shares()
+    
+    # Calculate NAV per share
+    nav_per_share = (current_nav / total_shares) if (current_nav and total_shares > 0) else 1.0
+    
+    # Display current metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("💰 NAV Atual", f"${current_nav:,.2f}" if current_nav else "N/A")
+    with col2:
+        st.metric("📋 Total Shares", f"{total_shares:,.4f}" if total_shares > 0 else "0")
+    with col3:
+        st.metric("📈 NAV per Share", f"${nav_per_share:,.4f}")
+    
+    st.markdown("---")
+    
+    # Check if initial deposit exists
+    if not share_transactions:
+        st.warning("⚠️ **Nenhum aporte inicial encontrado!** Por favor, insira o primeiro aporte abaixo para inicializar o sistema de cotas.")
+        st.info("💡 **Dica**: O primeiro aporte define as shares iniciais. Cota inicial = 1:1 (1 share = $1 USD)")
+    
+    # Tabs for different sections
+    nav_tab1, nav_tab2, nav_tab3, nav_tab4 = st.tabs([
+        "📈 Gráficos",
+        "💵 Aportes/Saques",
+        "📊 Importar NAV Histórico",
+        "🔄 Cotizar Agora"
+    ])
+    
+    # --- Graphs Tab ---
+    with nav_tab1:
+        st.subheader("📈 Evolução do NAV")
+        
+        # Debug info
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("📋 Total de Snapshots", len(nav_snapshots))
+        with col2:
+            st.metric("📈 NAV Atual", f"${current_nav:,.2f}" if current_nav else "N/A")
+        
+        # Check if we have any NAV data
+        has_sync_nav = any(h.get('nav') is not None for h in sync_history)
+        
+        if not nav_snapshots and not current_nav and not has_sync_nav:
+            st.info("📊 Nenhum dado de NAV disponível. Execute 'Analisar Hedge' no Dashboard ou importe dados históricos.")
+        else:
+            # Prepare data for graphs
+            nav_data = []
+            
+            # Add manual NAV snapshots
+            for snap in nav_snapshots:
+                nav_data.append({
+                    "timestamp": snap["timestamp"],
+                    "nav": snap["nav"],
+                    "source": "manual"
+                })
+            
+            # Add NAV from sync history (automatic)
+            for sync in sync_history:
+                if sync.get("nav") is not None:
+                    nav_data.append({
+                        "timestamp": sync["timestamp"],
+                        "nav": sync["nav"],
+                        "source": "sync"
+                    })
+            
+            # Add current NAV if available
+            if current_nav:
+                nav_data.append({
+                    "timestamp": datetime.now().isoformat(),
+                    "nav": current_nav,
+                    "source": "current"
+                })
+            
+            # Sort by timestamp
+            nav_data.sort(key=lambda x: x["timestamp"])
+            
+            # Calculate NAV per share for each point
+            for i, point in enumerate(nav_data):
+                # Find total shares at this point in time
+                shares_at_time = 0
+                for txn in share_transactions:
+                    if txn["timestamp"] <= point["timestamp"]:
+                        if txn["type"] == "deposit":
+                            shares_at_time += txn["shares"]
+                        elif txn["type"] == "withdrawal":
+                            shares_at_time -= txn["shares"]
+                
+                point["shares"] = shares_at_time
+                point["nav_per_share"] = (point["nav"] / shares_at_time) if shares_at_time > 0 else 1.0
+            
+            # Imported only when there is NAV history to plot
+            import plotly.graph_objects as go
+            import pandas as pd
+            df_nav = pd.DataFrame(nav_data)
+            df_nav["timestamp"] = pd.to_datetime(df_nav["timestamp"], format='ISO8601')
+            
+            # Graph 1: Absolute NAV
+            fig1 = go.Figure()
+            fig1.add_trace(go.Scatter(
+                x=df_nav["timestamp"],
+                y=df_nav["nav"],
+                mode='lines+markers',
+                name='NAV Absoluto',
+                line=dict(color='#1f77b4', width=2),
+                marker=dict(size=8)
+            ))
+            fig1.update_layout(
+                title="NAV Absoluto ao Longo do Tempo",
+                xaxis_title="Data",
+                yaxis_title="NAV (USD)",
+                hovermode='x unified',
+                template="plotly_dark"
+            )
+            st.plotly_chart(fig1, use_container_width=True)
+            
+            # Graph 2: NAV per Share
+            fig2 = go.Figure()
+            fig2.add_trace(go.Scatter(
+                x=df_nav["timestamp"],
+                y=df_nav["nav_per_share"],
+                mode='lines+markers',
+                name='NAV per Share',
+                line=dict(color='#2ca02c', width=2),
+                marker=dict(size=8)
+            ))
+            fig2.update_layout(
+                title="NAV per Share (Cotação) ao Longo do Tempo",
+                xaxis_title="Data",
+                yaxis_title="NAV per Share (USD)",
+                hovermode='x unified',
+                template="plotly_dark"
+            )
+            st.plotly_chart(fig2, use_container_width=True)
+            
+            # Performance metrics
+            if len(df_nav) > 1:
+                initial_nav_per_share = df_nav.iloc[0]["nav_per_share"]
+                current_nav_per_share = df_nav.iloc[-1]["nav_per_share"]
+                performance = ((current_nav_per_share - initial_nav_per_share) / initial_nav_per_share) * 100
+                
+                st.markdown("### 🎯 Performance")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Cotação Inicial", f"${initial_nav_per_share:,.4f}")
+                with col2:
+                    st.metric("Cotação Atual", f"${current_nav_per_share:,.4f}")
+                with col3:
+                    st.metric("Retorno %", f"{performance:+.2f}%")
+    
+    # --- Deposits/Withdrawals Tab ---
+    with nav_tab2:
+        st.subheader("💵 Gerenciar Aportes e Saques")
+        
+        # Get last quotation automatically
+        last_nav_per_share = 1.0  # Default for first deposit
+        
+        if nav_snapshots:
+            # Calculate NAV per share from last snapshot
+            last_snapshot = nav_snapshots[-1]  # Already sorted by timestamp
+            last_nav = last_snapshot["nav"]
+            
+            # Calculate shares AT THE SAME TIMESTAMP as the NAV snapshot
+            shares_at_last_snapshot = 0
+            for txn in share_transactions:
+                if txn["timestamp"] <= last_snapshot["timestamp"]:
+                    if txn["type"] == "deposit":
+                        shares_at_last_snapshot += txn["shares"]
+                    elif txn["type"] == "withdrawal":
+                        shares_at_last_snapshot -= txn["shares"]
+            
+            if shares_at_last_snapshot > 0:
+                last_nav_per_share = last_nav / shares_at_last_snapshot
+            else:
+                # If no shares at that time, use 1:1 (first deposit scenario)
+                last_nav_per_share = 1.0
+        
+        # Display last quotation info
+        if nav_snapshots:
+            last_snapshot_dt = datetime.fromisoformat(nav_snapshots[-1]["timestamp"])
+            st.info(f"📊 Última cotação: **${last_nav_per_share:,.4f}** por share (registrada em {last_snapshot_dt.strftime('%Y-%m-%d %H:%M')})")
+        else:
+            st.warning("⚠️ Nenhuma cotação registrada. Execute 'Analisar Hedge' no Dashboard para criar a primeira cotação.")
+        
+        # Add new transaction
+        with st.expander("➕ Adicionar Aporte/Saque"):
+            txn_type = st.selectbox("Tipo", ["deposit", "withdrawal"], format_func=lambda x: "Aporte" if x == "deposit" else "Saque")
+            txn_amount = st.number_input("Valor (USD)", min_value=0.01, step=0.01)
+            txn_date = st.date_input("Data")
+            txn_time = st.time_input("Hora")
+            txn_description = st.text_input("Descrição (opcional)")
+            
+            # Calculate shares based on last NAV per share
+            calculated_shares = txn_amount / last_nav_per_share
+            st.info(f"📋 Shares calculadas: **{calculated_shares:,.4f}** (baseado na última cotação de ${last_nav_per_share:,.4f})")
+            
+            if st.button("➕ Adicionar Transação", type="primary"):
+                txn_datetime = datetime.combine(txn_date, txn_time).isoformat()
+                
+                # Check if this exact transaction already exists
+                existing_txns = config_mgr.load_share_transactions()
+                duplicate = any(
+                    txn["timestamp"] == txn_datetime and 
+                    txn["type"] == txn_type and 
+                    txn["amount_usd"] == txn_amount
+                    for txn in existing_txns
+                )
+                
+                if duplicate:
+                    st.warning("⚠️ Esta transação já existe! Não foi adicionada novamente.")
+                else:
+                    config_mgr.add_share_transaction(
+                        txn_type,
+                        txn_amount,
+                        calculated_shares,
+                        last_nav_per_share,
+                        txn_description,
+                        txn_datetime
+                    )
+                    st.success("✅ Transação adicionada com sucesso!")
+                    st.rerun()
+        
+        # Display transactions table
+        st.markdown("### 📋 Histórico de Aportes/Saques")
+        
+        if not share_transactions:
+            st.info("📊 Nenhuma transação registrada.")
+        else:
+            # Sort by timestamp descending, keeping each row's index in the stored list
+            txn_order = sorted(range(len(share_transactions)), key=lambda i: share_transactions[i]["timestamp"], reverse=True)
+            
+            # One table instead of a row of columns + delete button per transaction
+            import pandas as pd
+            df_txns = pd.DataFrame([{
+                "Data": datetime.fromisoformat(share_transactions[i]["timestamp"]).strftime("%Y-%m-%d %H:%M"),
+                "Tipo": "Aporte" if share_transactions[i]["type"] == "deposit" else "Saque",
+                "Valor USD": share_transactions[i]["amount_usd"],
+                "Shares": share_transactions[i]["shares"],
+                "NAV/Share": share_transactions[i]["nav_per_share"],
+                "Descrição": share_transactions[i].get("description", ""),
+            } for i in txn_order])
+            txn_selection = st.dataframe(
+                df_txns,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="multi-row",
+                key="share_transactions_table",
+                column_config={
+                    "Valor USD": st.column_config.NumberColumn(format="$%.2f"),
+                    "Shares": st.column_config.NumberColumn(format="%.4f"),
+                    "NAV/Share": st.column_config.NumberColumn(format="$%.4f"),
+                },
+            )
+            
+            selected_txns = txn_selection.selection.rows
+            if st.button("❌ Excluir selecionadas", disabled=not selected_txns, help="Excluir as transações selecionadas"):
+                # Delete from the highest index down so the remaining indices stay valid
+                for original_idx in sorted((txn_order[row] for row in selected_txns), reverse=True):
+                    config_mgr.delete_share_transaction(original_idx)
+                st.rerun()
+    
+    # --- Import Historical NAV Tab ---
+    with nav_tab3:
+        st.subheader("📊 Importar NAV Histórico")
+        st.info("📌 Use esta seção para importar valores de NAV de períodos anteriores às sincronizações.")
+        
+        # Add historical NAV
+        with st.expander("➕ Adicionar NAV Histórico"):
+            hist_nav_value = st.number_input("Valor do NAV (USD)", min_value=0.01, step=0.01, key="hist_nav_value")
+            hist_nav_date = st.date_input("Data", key="hist_nav_date")
+            hist_nav_time = st.time_input("Hora", key="hist_nav_time")
+            
+            if st.button("➕ Adicionar NAV", type="primary", key="add_hist_nav_btn"):
+                hist_nav_datetime = datetime.combine(hist_nav_date, hist_nav_time).isoformat()
+                
+                # Check if this exact snapshot already exists
+                existing_snapshots = config_mgr.load_nav_snapshots()
+                duplicate = any(
+                    snap["timestamp"] == hist_nav_datetime and snap["nav"] == hist_nav_value
+                    for snap in existing_snapshots
+                )
+                
+                if duplicate:
+                    st.warning("⚠️ Este NAV já existe! Não foi adicionado novamente.")
+                else:
+                    config_mgr.add_nav_snapshot(hist_nav_value, hist_nav_datetime)
+                    st.success("✅ NAV histórico adicionado!")
+                    st.rerun()
+        
+        # Display historical NAV table
+        st.markdown("### 📋 NAV Histórico Importado")
+        
+        if not nav_snapshots:
+            st.info("📊 Nenhum NAV histórico importado.")
+        else:
+            # Sort by timestamp descending, keeping each row's index in the stored list
+            snap_order = sorted(range(len(nav_snapshots)), key=lambda i: nav_snapshots[i]["timestamp"], reverse=True)
+            
+            import pandas as pd
+            df_snaps = pd.DataFrame([{
+                "Data": datetime.fromisoformat(nav_snapshots[i]["timestamp"]).strftime("%Y-%m-%d %H:%M"),
+                "NAV": nav_snapshots[i]["nav"],
+            } for i in snap_order])
+            snap_selection = st.dataframe(
+                df_snaps,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="multi-row",
+                key="nav_snapshots_table",
+                column_config={
+                    "NAV": st.column_config.NumberColumn(format="$%.2f"),
+                },
+            )
+            
+            selected_snaps = snap_selection.selection.rows
+            if st.button("❌ Excluir selecionados", disabled=not selected_snaps, help="Excluir os NAVs selecionados", key="delete_nav_btn"):
+                # Delete from the highest index down so the remaining indices stay valid
+                for original_idx in sorted((snap_order[row] for row in selected_snaps), reverse=True):
+                    config_mgr.delete_nav_snapshot(original_idx)
+                st.rerun()
+    
+    # --- Quote Now Tab ---
+    with nav_tab4:
+        st.subheader("🔄 Cotizar Agora")
+        st.info("📌 Crie um snapshot do NAV atual para registrar a cotação antes de fazer aportes/saques.")
+        
+        if not current_nav:
+            st.warning("⚠️ Execute 'Analisar Hedge' no Dashboard primeiro para obter o NAV atual.")
+        else:
+            st.success(f"💰 **NAV Atual**: ${current_nav:,.2f}")
+            st.success(f"📋 **Total Shares**: {total_shares:,.4f}")
+            st.success(f"📈 **NAV per Share**: ${nav_per_share:,.4f}")
+            
+            if st.button("🔄 Cotizar Agora", type="primary"):
+                # Check if a snapshot with similar value and recent timestamp exists
+                existing_snapshots = config_mgr.load_nav_snapshots()
+                now = datetime.now()
+                recent_duplicate = any(
+                    abs(snap["nav"] - current_nav) < 0.01 and 
+                    abs((datetime.fromisoformat(snap["timestamp"]) - now).total_seconds()) < 60
+                    for snap in existing_snapshots
+                )
+                
+                if recent_duplicate:
+                    st.warning("⚠️ Uma cotação similar foi registrada recentemente. Não foi adicionada novamente.")
+                else:
+                    config_mgr.add_nav_snapshot(current_nav)
+                    st.success("✅ Cotação registrada com sucesso!")
+                    st.balloons()
+                    st.rerun()
+
+
+@st.fragment
+def render_dashboard_tab():
+    """Dashboard tab; its buttons rerun only this fragment"""
+    st.header("📊 Dashboard - Análise Delta-Neutral")
+    
+    last_sync = config_mgr.get_last_sync()
+    if last_sync:
+        last_sync_dt = datetime.fromisoformat(last_sync)
+        st.markdown(f"<p class=\"last-sync\">Última sincronização: {last_sync_dt.strftime('%Y-%m-%d %H:%M:%S')}</p>", unsafe_allow_html=True)
+    
+    config = get_active_config()
+    if not config or not config.get("api_key") or not config.get("wallet_address"):
+        st.warning("🚨 Por favor, configure sua API Key e endereço da carteira na aba 'Configuração'.")
+        st.stop()
+
+    # Notices from a manual sync survive the full rerun that follows it
+    for notice in st.session_state.pop("sync_notices", []):
+        st.success(notice)
+
+    if st.button("🔄 Analisar Hedge Agora"):
+        with st.spinner("Buscando dados do portfólio na Octav.fi..."):
+            client = get_octav_client(config["api_key"])
+            
+            # First sync
+            portfolio = client.get_portfolio(config["wallet_address"])
+            
+            if portfolio:
+                st.spinner("Aguardando 5 segundos para validação de todos os protocolos (especialmente Revert Finance)...")
+                time.sleep(5)
+                # Second sync for validation
+                portfolio = client.get_portfolio(config["wallet_address"])
+            
+            if not portfolio:
+                st.error("❌ Falha ao buscar dados do portfólio. Verifique sua API key e endereço.")
+                st.stop()
+            
+            sync_notices = ["✅ Sincronização manual concluída com dupla validação!"]
+            
+            # Save data to session state; positions and balances are derived
+            # once here and shared by every tab
+            store_portfolio_data(client, portfolio)
+            
+            # Get NAV value
+            nav_value = st.session_state.networth or None
+            
+            # Save sync history WITH NAV value
+            config_mgr.add_sync_history({"manual_sync": True}, nav_value=nav_value)
+            
+            # Auto-quote: Create NAV snapshot automatically
+            if nav_value:
+                # Check if a recent snapshot exists (within last 5 minutes)
+                existing_snapshots = config_mgr.load_nav_snapshots()
+                now = datetime.now()
+                recent_duplicate = any(
+                    abs(snap["nav"] - nav_value) < 0.01 and 
+                    abs((datetime.fromisoformat(snap["timestamp"]) - now).total_seconds()) < 300
+                    for snap in existing_snapshots
+                )
+                
+                if not recent_duplicate:
+                    config_mgr.add_nav_snapshot(nav_value)
+                    sync_notices.append("📈 Cotação registrada automaticamente!")
+            
+            # The other tabs read the new portfolio, so rerun the whole app
+            # rather than just this fragment
+            st.session_state.sync_notices = sync_notices
+            st.rerun()
+
+    if 'portfolio_data' in st.session_state:
+        data = st.session_state.portfolio_data
+        
+        # Display current NAV
+        # Networth parsed once at fetch time
+        networth = st.session_state.networth
+        st.metric("💰 NAV Atual", f"${networth:,.2f}")
+        
+        # --- Executive Summary ---
+        lp_value = float(data.get("total_lp_value", "0"))
+        hyperliquid_value = float(data.get("total_perp_value", "0"))
+        
+        lp_allocation_pct = (lp_value / networth * 100) if networth > 0 else 0
+        
+        all_lp_positions = st.session_state.lp_positions
+        perp_positions = st.session_state.perp_positions
+        
+        # Filter LP positions by enabled protocols
+        enabled_protocols = config.get("enabled_protocols", ["Revert", "Uniswap3", "Uniswap4", "Dhedge"])
+        lp_positions = [pos for pos in all_lp_positions if pos.protocol in enabled_protocols]
+        
+        lp_balances = OctavClient.aggregate_lp_balances(lp_positions)
+        short_balances = OctavClient.aggregate_short_balances(perp_positions)
+        
+        hedge_value_threshold_pct = config.get("hedge_value_threshold_pct", 10.0)
+        
+        # Extract token prices (normalize symbols to match lp_balances keys)
+        token_prices = OctavClient.extract_token_prices(lp_positions)
+        
+        analyzer = get_analyzer(hedge_value_threshold_pct, networth)
+        suggestions = compute_suggestions(
+            tuple(sorted(lp_balances.items())),
+            tuple(sorted(short_balances.items())),
+            tuple(sorted(token_prices.items())),
+            hedge_value_threshold_pct,
+            networth
+        )
+        
+        # Calculate hedge coverage and check if outside acceptable range
+        total_lp_value = sum(lp_balances.get(t, 0) * token_prices.get(t, 0) for t in lp_balances.keys())
+        total_short_value = sum(short_balances.get(t, 0) * token_prices.get(t, 0) for t in short_balances.keys())
+        
+        coverage_pct = (total_short_value / total_lp_value * 100) if total_lp_value > 0 else 0
+        coverage_trigger_activated = coverage_pct < 98.0 or coverage_pct > 102.0
+        
+        # If coverage trigger is activated, mark ALL suggestions with adjustments as required
+        if coverage_trigger_activated:
+            for s in suggestions:
+                if s.action != "none":
+                    s.priority = "required"
+        
+        # --- Display Executive Summary Cards ---
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("💰 Patrimônio Líquido Total", f"${networth:,.2f}")
+        with col2:
+            st.metric("💼 Alocação Ideal (LPs)", f"{lp_allocation_pct:.1f}%", delta=f"{lp_allocation_pct-80:.1f}% vs 80%", delta_color="inverse")
+        with col3:
+            st.metric("⚖️ Hedge Delta-Neutral", f"{len(suggestions)} tokens", help="Número de tokens sendo monitorados para hedge.")
+        with col4:
+            st.metric("📉 Shorts Ativos", len(short_balances), help="Número de posições short na Hyperliquid.")
+
+        st.markdown("--- ")
+        
+        # --- Detailed Analysis ---
+        st.subheader("📊 Análise Detalhada")
+        
+        # Check if trigger is activated based on priority
+        trigger_activated = any(s.priority == "required" for s in suggestions)
+        
+        if trigger_activated:
+            trigger_reasons = []
+            if coverage_trigger_activated:
+                trigger_reasons.append(f"Cobertura de hedge fora do range 98-102% (atual: {coverage_pct:.1f}%)")
+            if any(s.priority == "required" and s.adjustment_value_usd / networth * 100 >= hedge_value_threshold_pct for s in suggestions):
+                trigger_reasons.append(f"Pelo menos uma posição tem ajuste maior que {hedge_value_threshold_pct}% do capital")
+            
+            trigger_text = " | ".join(trigger_reasons)
+            st.warning(f"⚡ **GATILHO DE REBALANCEAMENTO ACIONADO!** {trigger_text}. **TODAS as posições com desvio serão ajustadas**.")
+        else:
+            st.success(f"✅ Nenhuma posição requer ajuste obrigatório. Cobertura de hedge: {coverage_pct:.1f}% (range aceitável: 98-102%)")
+
+        # Display suggestions
+        if not suggestions:
+            st.info("✅ Nenhuma posição para analisar ou todas as posições estão perfeitamente balanceadas.")
+        else:
+            # Separate by status (single pass)
+            buckets = DeltaNeutralAnalyzer.group_by_status(suggestions)
+            balanced = buckets["balanced"]
+            under_hedged = buckets["under_hedged"]
+            over_hedged = buckets["over_hedged"]
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("✅ Balanceadas", len(balanced))
+            with col2:
+                st.metric("⚠️ Sub-Hedge", len(under_hedged))
+            with col3:
+                st.metric("⚠️ Sobre-Hedge", len(over_hedged))
+        
+            st.markdown("---")
+
+            # One table for all tokens instead of a header + 3 metrics per token;
+            # the per-token metrics are shown only for the selected row
+            import pandas as pd
+            sorted_suggestions = sorted(suggestions, key=lambda x: x.priority, reverse=True)
+            status_labels = {
+                "balanced": "✅ Balanceada",
+                "under_hedged": "⚠️ Sub-Hedge",
+                "over_hedged": "⚠️ Sobre-Hedge",
+            }
+            action_labels = {
+                "none": "-",
+                "increase_short": "🔺 Aumentar short",
+                "decrease_short": "🔻 Diminuir short",
+            }
+            df_suggestions = pd.DataFrame([{
+                "Token": s.token,
+                "Status": status_labels.get(s.status, s.status),
+                "LP Balance": s.lp_balance,
+                "Short Balance": s.short_balance,
+                "Diferença": s.difference,
+                "Diferença %": s.difference_pct,
+                "Ação": action_labels.get(s.action, s.action),
+                "Ajuste": s.adjustment_amount,
+                "Ajuste USD": s.adjustment_value_usd,
+            } for s in sorted_suggestions])
+            selection = st.dataframe(
+                df_suggestions,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="suggestions_table",
+                column_config={
+                    "LP Balance": st.column_config.NumberColumn(format="%.6f"),
+                    "Short Balance": st.column_config.NumberColumn(format="%.6f"),
+                    "Diferença": st.column_config.NumberColumn(format="%+.6f"),
+                    "Diferença %": st.column_config.NumberColumn(format="%.2f%%"),
+                    "Ajuste": st.column_config.NumberColumn(format="%.6f"),
+                    "Ajuste USD": st.column_config.NumberColumn(format="$%.2f"),
+                },
+            )
+            
+            # Action notes for every token with an adjustment, in one block
+            action_lines = []
+            for s in sorted_suggestions:
+                if s.action != "none":
+                    action_text = "AUMENTAR" if s.action == "increase_short" else "DIMINUIR"
+                    
+                    # Show priority based on value threshold
+                    priority_emoji = "🔴" if s.priority == "required" else "🟡"
+                    priority_text = "OBRIGATÓRIO" if s.priority == "required" else "OPCIONAL"
+                    
+                    value_pct_of_capital = (s.adjustment_value_usd / networth * 100) if networth > 0 else 0
+                    
+                    action_lines.append(f"- {priority_emoji} **{priority_text}**: {action_text} SHORT em **{s.adjustment_amount:.6f} {s.token}** (${s.adjustment_value_usd:,.2f} = {value_pct_of_capital:.1f}% do capital)")
+            if action_lines:
+                st.info("\n".join(action_lines))
+            
+            selected_rows = selection.selection.rows
+            if selected_rows:
+                s = sorted_suggestions[selected_rows[0]]
+                st.markdown(f"#### {s.token} - {s.status.upper().replace('_', ' ')}")
+                
+                col1, col2, col3 = st.columns(3)
+                
+                lp_value_usd = s.lp_balance * token_prices.get(s.token, 0)
+                short_value_usd = s.short_balance * token_prices.get(s.token, 0)
+                diff_usd = s.difference * token_prices.get(s.token, 0)
+
+                col1.metric("LP Balance", f"{s.lp_balance:.6f} {s.token}", f"${lp_value_usd:,.2f} USD")
+                col2.metric("Short Balance", f"{s.short_balance:.6f} {s.token}", f"${short_value_usd:,.2f} USD")
+                col3.metric("Diferença", f"{s.difference:+.6f} {s.token} ({s.difference_pct:.2f}%)", f"${diff_usd:+,.2f} USD")
+            else:
+                st.caption("Selecione uma linha para ver o detalhe do token.")
+
+        # --- Action Summary & Execution ---
+        st.subheader("📋 Resumo de Ações Necessárias")
+        
+        action_summary = analyzer.get_action_summary(suggestions)
+        increase_actions = action_summary.get("increase_short", {})
+        decrease_actions = action_summary.get("decrease_short", {})
+        
+        if not increase_actions and not decrease_actions:
+            st.success("✅ Nenhuma ação de hedge necessária no momento.")
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                # One markdown block per column instead of one element per token
+                if increase_actions:
+                    st.markdown("**🔺 AUMENTAR SHORT:**\n" + "\n".join(
+                        f"- **{token}**: `+{amount:.6f}`" for token, amount in increase_actions.items()
+                    ))
+            with col2:
+                if decrease_actions:
+                    st.markdown("**🔻 DIMINUIR SHORT:**\n" + "\n".join(
+                        f"- **{token}**: `-{amount:.6f}`" for token, amount in decrease_actions.items()
+                    ))
+
+            st.subheader("⚡ Execução Automática")
+            st.warning("🚨 ATENÇÃO: Isso irá executar ordens reais na Hyperliquid!")
+            
+            if st.button("Executar Todos os Ajustes", key="exec_all"):
+                hyperliquid_private_key = config.get("hyperliquid_private_key")
+                if not hyperliquid_private_key:
+                    st.error("❌ Chave privada da Hyperliquid não configurada.")
+                    st.stop()
+                
+                with st.spinner("Executando ajustes na Hyperliquid..."):
+                    from hyperliquid_client import HyperliquidClient
+                    hl_client = HyperliquidClient(config["wallet_address"], hyperliquid_private_key)
+                    
+                    adjustments_to_exec = []
+                    for token, amount in increase_actions.items():
+                        adjustments_to_exec.append({"token": token, "action": "increase_short", "amount": amount})
+                    for token, amount in decrease_actions.items():
+                        adjustments_to_exec.append({"token": token, "action": "decrease_short", "amount": amount})
+                    
+                    results = hl_client.execute_adjustments(adjustments_to_exec)
+                    
+                    st.success("✅ Execução concluída!")
+                    
+                    # Log results; they are displayed together in one markdown block
+                    result_lines = []
+                    for result in results:
+                        if result['result'].success:
+                            result_lines.append(f"- **{result['token']}**: {result['action'].replace('_', ' ').title()} de {result['amount']:.6f} - ✅ SUCESSO (Ordem {result['result'].order_id})")
+                            config_mgr.add_execution_history({
+                                'token': result['token'],
+                                'action': result['action'],
+                                'amount': result['amount'],
+                                'order_value_usd': result.get('order_value_usd', 0),
+                                'success': True,
+                                'message': f"Order ID: {result['result'].order_id}",
+                                'order_id': result['result'].order_id,
+                                'filled_size': result['result'].filled_size,
+                                'avg_price': result['result'].avg_price,
+                                'auto_executed': False
+                            })
+                        else:
+                            result_lines.append(f"- **{result['token']}**: {result['action'].replace('_', ' ').title()} de {result['amount']:.6f} - ❌ FALHA: {result['result'].message}")
+                            config_mgr.add_execution_history({
+                                'token': result['token'],
+                                'action': result['action'],
+                                'amount': result['amount'],
+                                'success': False,
+                                'message': result['result'].message,
+                                'auto_executed': False
+                            })
+                    st.markdown("\n".join(result_lines))
+
+
+# Rows per page in the sync/execution history tables
+HISTORY_PAGE_SIZE = 50
+
+@st.fragment
+def render_history_table(records, key):
+    """Render history records (stored newest first) one page at a time; paging reruns only this table"""
+    import pandas as pd
+    total_pages = max(1, -(-len(records) // HISTORY_PAGE_SIZE))
+    page = 1
+    if total_pages > 1:
+        page = st.number_input("Página", min_value=1, max_value=total_pages, value=1, key=f"{key}_page")
+    
+    page_records = records[(page - 1) * HISTORY_PAGE_SIZE:page * HISTORY_PAGE_SIZE]
+    
+    df = pd.DataFrame(page_records)
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    st.dataframe(df, use_container_width=True)
+    if total_pages > 1:
+        st.caption(f"Página {page} de {total_pages} ({len(records)} registros)")
+
+
 # --- Main App ---
 def main():
     """Main Streamlit application"""
@@ -278,9 +1047,11 @@ def main():
                 key="wallet_selector"
             )
             
-            # Update active wallet if changed
+            # Update active wallet if changed; the fetched portfolio belongs to
+            # the previous wallet, so it is dropped instead of shown for this one
             if selected_wallet != active_wallet_id:
                 config_mgr.set_active_wallet(selected_wallet)
+                clear_portfolio_data()
                 st.rerun()
             
             st.success(f"✅ Wallet ativa: **{wallets[selected_wallet].get('name', 'Unnamed')}**")
@@ -289,10 +1060,12 @@ def main():
         
         # Add new wallet
         with st.expander("➕ Adicionar Nova Wallet"):
-            new_wallet_name = st.text_input("Nome da Wallet", key="new_wallet_name")
-            new_wallet_address = st.text_input("Endereço da Wallet", key="new_wallet_address")
+            with st.form("add_wallet_form", clear_on_submit=False):
+                new_wallet_name = st.text_input("Nome da Wallet", key="new_wallet_name")
+                new_wallet_address = st.text_input("Endereço da Wallet", key="new_wallet_address")
+                add_wallet_submitted = st.form_submit_button("➕ Adicionar", type="primary")
             
-            if st.button("➕ Adicionar", type="primary", key="add_wallet_btn"):
+            if add_wallet_submitted:
                 if new_wallet_name and new_wallet_address:
                     success, message = config_mgr.add_wallet(new_wallet_address, new_wallet_name)
                     if success:
@@ -342,51 +1115,62 @@ def main():
         
         existing_config = get_active_config()
         
-        col1, col2 = st.columns(2)
+        # Kept outside the form so the real-money warning follows the checkbox
+        # live; the value is saved together with the form
+        st.markdown("###  execution Automática")
+        auto_execute_enabled = st.checkbox("Ativar Execução Automática", value=existing_config.get("auto_execute_enabled", False) if existing_config else False)
+        if auto_execute_enabled:
+            st.warning("🚨 ATENÇÃO: A execução automática irá realizar ordens reais na Hyperliquid sem confirmação manual!")
+        else:
+            st.info("ℹ️ Modo somente análise (sem execução)")
         
-        with col1:
-            st.markdown("### 🔑 Chaves de API")
-            api_key = st.text_input("Octav.fi API Key", value=existing_config.get("api_key", "") if existing_config else "", type="password")
-            wallet_address = st.text_input("Endereço da Carteira", value=existing_config.get("wallet_address", "") if existing_config else "")
-            hyperliquid_private_key = st.text_input("Chave Privada Hyperliquid (para execução)", value=existing_config.get("hyperliquid_private_key", "") if existing_config else "", type="password")
-            
-            st.markdown("### 🔄 Sincronização Automática")
-            auto_sync_enabled = st.checkbox("Ativar Auto-Sync", value=existing_config.get("auto_sync_enabled", False) if existing_config else False)
-            auto_sync_interval_hours = st.number_input("Intervalo de Auto-Sync (horas)", min_value=1, max_value=24, value=existing_config.get("auto_sync_interval_hours", 4) if existing_config else 4)
-
-            st.markdown("###  execution Automática")
-            auto_execute_enabled = st.checkbox("Ativar Execução Automática", value=existing_config.get("auto_execute_enabled", False) if existing_config else False)
-            if auto_execute_enabled:
-                st.warning("🚨 ATENÇÃO: A execução automática irá realizar ordens reais na Hyperliquid sem confirmação manual!")
-            else:
-                st.info("ℹ️ Modo somente análise (sem execução)")
-    
-        with col2:
-            st.markdown("### ⚙️ Parâmetros")
-            
-            hedge_value_threshold_pct = st.slider(
-                "Gatilho de Hedge (% do Capital)", 
-                min_value=0.0, 
-                max_value=50.0, 
-                value=existing_config.get("hedge_value_threshold_pct", 10.0) if existing_config else 10.0,
-                step=0.5,
-                help="Valor mínimo (como % do patrimônio total) que um ajuste deve ter para ser considerado 'OBRIGATÓRIO'. Ativa o rebalanceamento completo."
-            )
-
-            st.markdown("###  protocols Habilitados")
-            all_protocols = ["Revert", "Uniswap3", "Uniswap4", "Dhedge"]
-            enabled_protocols = st.multiselect(
-                "Selecione os protocolos para incluir na análise",
-                options=all_protocols,
-                default=existing_config.get("enabled_protocols", all_protocols) if existing_config else all_protocols
-            )
+        # Inputs are buffered in a form, so typing and slider ticks only rerun
+        # the script once, on save
+        with st.form("config_form", clear_on_submit=False):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("### 🔑 Chaves de API")
+                api_key = st.text_input("Octav.fi API Key", value=existing_config.get("api_key", "") if existing_config else "", type="password")
+                wallet_address = st.text_input("Endereço da Carteira", value=existing_config.get("wallet_address", "") if existing_config else "")
+                hyperliquid_private_key = st.text_input("Chave Privada Hyperliquid (para execução)", value=existing_config.get("hyperliquid_private_key", "") if existing_config else "", type="password")
+                
+                st.markdown("### 🔄 Sincronização Automática")
+                auto_sync_enabled = st.checkbox("Ativar Auto-Sync", value=existing_config.get("auto_sync_enabled", False) if existing_config else False)
+                auto_sync_interval_hours = st.number_input("Intervalo de Auto-Sync (horas)", min_value=1, max_value=24, value=existing_config.get("auto_sync_interval_hours", 4) if existing_config else 4)
+        
+            with col2:
+                st.markdown("### ⚙️ Parâmetros")
+                
+                hedge_value_threshold_pct = st.slider(
+                    "Gatilho de Hedge (% do Capital)", 
+                    min_value=0.0, 
+                    max_value=50.0, 
+                    value=existing_config.get("hedge_value_threshold_pct", 10.0) if existing_config else 10.0,
+                    step=0.5,
+                    help="Valor mínimo (como % do patrimônio total) que um ajuste deve ter para ser considerado 'OBRIGATÓRIO'. Ativa o rebalanceamento completo."
+                )
 
-        if st.button("Salvar Configuração"):
+                st.markdown("###  protocols Habilitados")
+                all_protocols = ["Revert", "Uniswap3", "Uniswap4", "Dhedge"]
+                enabled_protocols = st.multiselect(
+                    "Selecione os protocolos para incluir na análise",
+                    options=all_protocols,
+                    default=existing_config.get("enabled_protocols", all_protocols) if existing_config else all_protocols
+                )
+            
+            submitted = st.form_submit_button("Salvar Configuração")
+        
+        if submitted:
             # Get current wallet config and update it
             wallet_config = get_active_config()
             if not wallet_config:
                 st.error("⚠️ Nenhuma wallet ativa. Adicione uma wallet na sidebar.")
             else:
+                # A portfolio fetched with other credentials is stale; only the
+                # session's portfolio is dropped, nothing else
+                if (wallet_config.get("api_key"), wallet_config.get("wallet_address")) != (api_key, wallet_address):
+                    clear_portfolio_data()
                 wallet_config.update({
                     "api_key": api_key,
                     "wallet_address": wallet_address,
@@ -425,6 +1209,9 @@ def main():
         
         with col_restore:
             st.markdown("#### 📤 Restaurar Backup")
+            restored_message = st.session_state.pop("backup_restored", None)
+            if restored_message:
+                st.success(f"✅ {restored_message}")
             uploaded_file = st.file_uploader("Escolha um arquivo de backup JSON", type=["json"], key="backup_restore")
             
             if uploaded_file is not None:
@@ -438,8 +1225,11 @@ def main():
                         success, message = config_mgr.restore_backup(backup_data)
                         
                         if success:
-                            st.success(f"✅ {message}")
-                            st.info("🔄 Recarregue a página para ver as mudanças.")
+                            # Wallets and history changed on disk: drop the
+                            # fetched portfolio and rerun instead of asking for a reload
+                            clear_portfolio_data()
+                            st.session_state.backup_restored = message
+                            st.rerun()
                         else:
                             st.error(f"❌ {message}")
                 
@@ -450,659 +1240,17 @@ def main():
 
     # --- NAV Tab ---
     with tab_nav:
-        st.header("📈 NAV (Net Asset Value)")
-        st.info("📊 Acompanhe o valor líquido do seu portfólio e a evolução da cotação, desconsiderando aportes e saques.")
-        
-        import plotly.graph_objects as go
-        import pandas as pd
-        # Load NAV data
-        nav_snapshots = config_mgr.load_nav_snapshots()
-        share_transactions = config_mgr.load_share_transactions()
-        sync_history = config_mgr.load_history()  # Load sync history with NAV values
-        
-        # Calculate current NAV from portfolio data if available
-        current_nav = None
-        if 'portfolio_data' in st.session_state:
-            nav_value = st.session_state['portfolio_data'].get('networth', 0)
-            current_nav = float(nav_value) if nav_value else None
-        
-        # Calculate total shares
-        total_shares = config_mgr.get_total_shares()
-        
-        # Calculate NAV per share
-        nav_per_share = (current_nav / total_shares) if (current_nav and total_shares > 0) else 1.0
-        
-        # Display current metrics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("💰 NAV Atual", f"${current_nav:,.2f}" if current_nav else "N/A")
-        with col2:
-            st.metric("📋 Total Shares", f"{total_shares:,.4f}" if total_shares > 0 else "0")
-        with col3:
-            st.metric("📈 NAV per Share", f"${nav_per_share:,.4f}")
-        
-        st.markdown("---")
-        
-        # Check if initial deposit exists
-        if not share_transactions:
-            st.warning("⚠️ **Nenhum aporte inicial encontrado!** Por favor, insira o primeiro aporte abaixo para inicializar o sistema de cotas.")
-            st.info("💡 **Dica**: O primeiro aporte define as shares iniciais. Cota inicial = 1:1 (1 share = $1 USD)")
-        
-        # Tabs for different sections
-        nav_tab1, nav_tab2, nav_tab3, nav_tab4 = st.tabs([
-            "📈 Gráficos",
-            "💵 Aportes/Saques",
-            "📊 Importar NAV Histórico",
-            "🔄 Cotizar Agora"
-        ])
-        
-        # --- Graphs Tab ---
-        with nav_tab1:
-            st.subheader("📈 Evolução do NAV")
-            
-            # Debug info
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("📋 Total de Snapshots", len(nav_snapshots))
-            with col2:
-                st.metric("📈 NAV Atual", f"${current_nav:,.2f}" if current_nav else "N/A")
-            
-            # Check if we have any NAV data
-            has_sync_nav = any(h.get('nav') is not None for h in sync_history)
-            
-            if not nav_snapshots and not current_nav and not has_sync_nav:
-                st.info("📊 Nenhum dado de NAV disponível. Execute 'Analisar Hedge' no Dashboard ou importe dados históricos.")
-            else:
-                # Prepare data for graphs
-                nav_data = []
-                
-                # Add manual NAV snapshots
-                for snap in nav_snapshots:
-                    nav_data.append({
-                        "timestamp": snap["timestamp"],
-                        "nav": snap["nav"],
-                        "source": "manual"
-                    })
-                
-                # Add NAV from sync history (automatic)
-                for sync in sync_history:
-                    if sync.get("nav") is not None:
-                        nav_data.append({
-                            "timestamp": sync["timestamp"],
-                            "nav": sync["nav"],
-                            "source": "sync"
-                        })
-                
-                # Add current NAV if available
-                if current_nav:
-                    nav_data.append({
-                        "timestamp": datetime.now().isoformat(),
-                        "nav": current_nav,
-                        "source": "current"
-                    })
-                
-                # Sort by timestamp
-                nav_data.sort(key=lambda x: x["timestamp"])
-                
-                # Calculate NAV per share for each point
-                for i, point in enumerate(nav_data):
-                    # Find total shares at this point in time
-                    shares_at_time = 0
-                    for txn in share_transactions:
-                        if txn["timestamp"] <= point["timestamp"]:
-                            if txn["type"] == "deposit":
-                                shares_at_time += txn["shares"]
-                            elif txn["type"] == "withdrawal":
-                                shares_at_time -= txn["shares"]
-                    
-                    point["shares"] = shares_at_time
-                    point["nav_per_share"] = (point["nav"] / shares_at_time) if shares_at_time > 0 else 1.0
-                
-                df_nav = pd.DataFrame(nav_data)
-                df_nav["timestamp"] = pd.to_datetime(df_nav["timestamp"], format='ISO8601')
-                
-                # Graph 1: Absolute NAV
-                fig1 = go.Figure()
-                fig1.add_trace(go.Scatter(
-                    x=df_nav["timestamp"],
-                    y=df_nav["nav"],
-                    mode='lines+markers',
-                    name='NAV Absoluto',
-                    line=dict(color='#1f77b4', width=2),
-                    marker=dict(size=8)
-                ))
-                fig1.update_layout(
-                    title="NAV Absoluto ao Longo do Tempo",
-                    xaxis_title="Data",
-                    yaxis_title="NAV (USD)",
-                    hovermode='x unified',
-                    template="plotly_dark"
-                )
-                st.plotly_chart(fig1, use_container_width=True)
-                
-                # Graph 2: NAV per Share
-                fig2 = go.Figure()
-                fig2.add_trace(go.Scatter(
-                    x=df_nav["timestamp"],
-                    y=df_nav["nav_per_share"],
-                    mode='lines+markers',
-                    name='NAV per Share',
-                    line=dict(color='#2ca02c', width=2),
-                    marker=dict(size=8)
-                ))
-                fig2.update_layout(
-                    title="NAV per Share (Cotação) ao Longo do Tempo",
-                    xaxis_title="Data",
-                    yaxis_title="NAV per Share (USD)",
-                    hovermode='x unified',
-                    template="plotly_dark"
-                )
-                st.plotly_chart(fig2, use_container_width=True)
-                
-                # Performance metrics
-                if len(df_nav) > 1:
-                    initial_nav_per_share = df_nav.iloc[0]["nav_per_share"]
-                    current_nav_per_share = df_nav.iloc[-1]["nav_per_share"]
-                    performance = ((current_nav_per_share - initial_nav_per_share) / initial_nav_per_share) * 100
-                    
-                    st.markdown("### 🎯 Performance")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Cotação Inicial", f"${initial_nav_per_share:,.4f}")
-                    with col2:
-                        st.metric("Cotação Atual", f"${current_nav_per_share:,.4f}")
-                    with col3:
-                        st.metric("Retorno %", f"{performance:+.2f}%")
-        
-        # --- Deposits/Withdrawals Tab ---
-        with nav_tab2:
-            st.subheader("💵 Gerenciar Aportes e Saques")
-            
-            # Get last quotation automatically
-            last_nav_per_share = 1.0  # Default for first deposit
-            
-            if nav_snapshots:
-                # Calculate NAV per share from last snapshot
-                last_snapshot = nav_snapshots[-1]  # Already sorted by timestamp
-                last_nav = last_snapshot["nav"]
-                
-                # Calculate shares AT THE SAME TIMESTAMP as the NAV snapshot
-                shares_at_last_snapshot = 0
-                for txn in share_transactions:
-                    if txn["timestamp"] <= last_snapshot["timestamp"]:
-                        if txn["type"] == "deposit":
-                            shares_at_last_snapshot += txn["shares"]
-                        elif txn["type"] == "withdrawal":
-                            shares_at_last_snapshot -= txn["shares"]
-                
-                if shares_at_last_snapshot > 0:
-                    last_nav_per_share = last_nav / shares_at_last_snapshot
-                else:
-                    # If no shares at that time, use 1:1 (first deposit scenario)
-                    last_nav_per_share = 1.0
-            
-            # Display last quotation info
-            if nav_snapshots:
-                last_snapshot_dt = datetime.fromisoformat(nav_snapshots[-1]["timestamp"])
-                st.info(f"📊 Última cotação: **${last_nav_per_share:,.4f}** por share (registrada em {last_snapshot_dt.strftime('%Y-%m-%d %H:%M')})")
-            else:
-                st.warning("⚠️ Nenhuma cotação registrada. Execute 'Analisar Hedge' no Dashboard para criar a primeira cotação.")
-            
-            # Add new transaction
-            with st.expander("➕ Adicionar Aporte/Saque"):
-                txn_type = st.selectbox("Tipo", ["deposit", "withdrawal"], format_func=lambda x: "Aporte" if x == "deposit" else "Saque")
-                txn_amount = st.number_input("Valor (USD)", min_value=0.01, step=0.01)
-                txn_date = st.date_input("Data")
-                txn_time = st.time_input("Hora")
-                txn_description = st.text_input("Descrição (opcional)")
-                
-                # Calculate shares based on last NAV per share
-                calculated_shares = txn_amount / last_nav_per_share
-                st.info(f"📋 Shares calculadas: **{calculated_shares:,.4f}** (baseado na última cotação de ${last_nav_per_share:,.4f})")
-                
-                if st.button("➕ Adicionar Transação", type="primary"):
-                    txn_datetime = datetime.combine(txn_date, txn_time).isoformat()
-                    
-                    # Check if this exact transaction already exists
-                    existing_txns = config_mgr.load_share_transactions()
-                    duplicate = any(
-                        txn["timestamp"] == txn_datetime and 
-                        txn["type"] == txn_type and 
-                        txn["amount_usd"] == txn_amount
-                        for txn in existing_txns
-                    )
-                    
-                    if duplicate:
-                        st.warning("⚠️ Esta transação já existe! Não foi adicionada novamente.")
-                    else:
-                        config_mgr.add_share_transaction(
-                            txn_type,
-                            txn_amount,
-                            calculated_shares,
-                            last_nav_per_share,
-                            txn_description,
-                            txn_datetime
-                        )
-                        st.success("✅ Transação adicionada com sucesso!")
-                        st.rerun()
-            
-            # Display transactions table
-            st.markdown("### 📋 Histórico de Aportes/Saques")
-            
-            if not share_transactions:
-                st.info("📊 Nenhuma transação registrada.")
-            else:
-                # Sort by timestamp descending
-                sorted_txns = sorted(share_transactions, key=lambda x: x["timestamp"], reverse=True)
-                
-                # Header
-                col1, col2, col3, col4, col5, col6, col7 = st.columns([2, 1, 1.5, 1.5, 1.5, 2, 0.5])
-                with col1:
-                    st.markdown("**Data**")
-                with col2:
-                    st.markdown("**Tipo**")
-                with col3:
-                    st.markdown("**Valor USD**")
-                with col4:
-                    st.markdown("**Shares**")
-                with col5:
-                    st.markdown("**NAV/Share**")
-                with col6:
-                    st.markdown("**Descrição**")
-                with col7:
-                    st.markdown("**Ação**")
-                
-                st.markdown("---")
-                
-                # Display each transaction with delete button
-                for idx, txn in enumerate(sorted_txns):
-                    # Find original index in unsorted list
-                    original_idx = share_transactions.index(txn)
-                    
-                    col1, col2, col3, col4, col5, col6, col7 = st.columns([2, 1, 1.5, 1.5, 1.5, 2, 0.5])
-                    
-                    with col1:
-                        timestamp_dt = datetime.fromisoformat(txn["timestamp"])
-                        st.text(timestamp_dt.strftime("%Y-%m-%d %H:%M"))
-                    
-                    with col2:
-                        tipo = "Aporte" if txn["type"] == "deposit" else "Saque"
-                        st.text(tipo)
-                    
-                    with col3:
-                        st.text(f"${txn['amount_usd']:,.2f}")
-                    
-                    with col4:
-                        st.text(f"{txn['shares']:,.4f}")
-                    
-                    with col5:
-                        st.text(f"${txn['nav_per_share']:,.4f}")
-                    
-                    with col6:
-                        st.text(txn.get("description", ""))
-                    
-                    with col7:
-                        if st.button("❌", key=f"delete_txn_{idx}", help="Excluir esta transação"):
-                            config_mgr.delete_share_transaction(original_idx)
-                            st.rerun()
-        
-        # --- Import Historical NAV Tab ---
-        with nav_tab3:
-            st.subheader("📊 Importar NAV Histórico")
-            st.info("📌 Use esta seção para importar valores de NAV de períodos anteriores às sincronizações.")
-            
-            # Add historical NAV
-            with st.expander("➕ Adicionar NAV Histórico"):
-                hist_nav_value = st.number_input("Valor do NAV (USD)", min_value=0.01, step=0.01, key="hist_nav_value")
-                hist_nav_date = st.date_input("Data", key="hist_nav_date")
-                hist_nav_time = st.time_input("Hora", key="hist_nav_time")
-                
-                if st.button("➕ Adicionar NAV", type="primary", key="add_hist_nav_btn"):
-                    hist_nav_datetime = datetime.combine(hist_nav_date, hist_nav_time).isoformat()
-                    
-                    # Check if this exact snapshot already exists
-                    existing_snapshots = config_mgr.load_nav_snapshots()
-                    duplicate = any(
-                        snap["timestamp"] == hist_nav_datetime and snap["nav"] == hist_nav_value
-                        for snap in existing_snapshots
-                    )
-                    
-                    if duplicate:
-                        st.warning("⚠️ Este NAV já existe! Não foi adicionado novamente.")
-                    else:
-                        config_mgr.add_nav_snapshot(hist_nav_value, hist_nav_datetime)
-                        st.success("✅ NAV histórico adicionado!")
-                        st.rerun()
-            
-            # Display historical NAV table
-            st.markdown("### 📋 NAV Histórico Importado")
-            
-            if not nav_snapshots:
-                st.info("📊 Nenhum NAV histórico importado.")
-            else:
-                # Sort by timestamp descending
-                sorted_snapshots = sorted(nav_snapshots, key=lambda x: x["timestamp"], reverse=True)
-                
-                # Display each snapshot with delete button
-                for idx, snap in enumerate(sorted_snapshots):
-                    # Find original index in unsorted list
-                    original_idx = nav_snapshots.index(snap)
-                    
-                    col1, col2, col3 = st.columns([3, 3, 1])
-                    
-                    with col1:
-                        timestamp_dt = datetime.fromisoformat(snap["timestamp"])
-                        st.text(timestamp_dt.strftime("%Y-%m-%d %H:%M"))
-                    
-                    with col2:
-                        st.text(f"${snap['nav']:,.2f}")
-                    
-                    with col3:
-                        if st.button("❌", key=f"delete_nav_{idx}", help="Excluir este NAV"):
-                            config_mgr.delete_nav_snapshot(original_idx)
-                            st.rerun()
-        
-        # --- Quote Now Tab ---
-        with nav_tab4:
-            st.subheader("🔄 Cotizar Agora")
-            st.info("📌 Crie um snapshot do NAV atual para registrar a cotação antes de fazer aportes/saques.")
-            
-            if not current_nav:
-                st.warning("⚠️ Execute 'Analisar Hedge' no Dashboard primeiro para obter o NAV atual.")
-            else:
-                st.success(f"💰 **NAV Atual**: ${current_nav:,.2f}")
-                st.success(f"📋 **Total Shares**: {total_shares:,.4f}")
-                st.success(f"📈 **NAV per Share**: ${nav_per_share:,.4f}")
-                
-                if st.button("🔄 Cotizar Agora", type="primary"):
-                    # Check if a snapshot with similar value and recent timestamp exists
-                    existing_snapshots = config_mgr.load_nav_snapshots()
-                    now = datetime.now()
-                    recent_duplicate = any(
-                        abs(snap["nav"] - current_nav) < 0.01 and 
-                        abs((datetime.fromisoformat(snap["timestamp"]) - now).total_seconds()) < 60
-                        for snap in existing_snapshots
-                    )
-                    
-                    if recent_duplicate:
-                        st.warning("⚠️ Uma cotação similar foi registrada recentemente. Não foi adicionada novamente.")
-                    else:
-                        config_mgr.add_nav_snapshot(current_nav)
-                        st.success("✅ Cotação registrada com sucesso!")
-                        st.balloons()
-                        st.rerun()
+        render_nav_tab()
     
     # --- Dashboard Tab ---
     with tab_dashboard:
-        st.header("📊 Dashboard - Análise Delta-Neutral")
-        
-        last_sync = config_mgr.get_last_sync()
-        if last_sync:
-            last_sync_dt = datetime.fromisoformat(last_sync)
-            st.markdown(f"<p class=\"last-sync\">Última sincronização: {last_sync_dt.strftime('%Y-%m-%d %H:%M:%S')}</p>", unsafe_allow_html=True)
-        
-        config = get_active_config()
-        if not config or not config.get("api_key") or not config.get("wallet_address"):
-            st.warning("🚨 Por favor, configure sua API Key e endereço da carteira na aba 'Configuração'.")
-            st.stop()
-
-        if st.button("🔄 Analisar Hedge Agora"):
-            with st.spinner("Buscando dados do portfólio na Octav.fi..."):
-                client = OctavClient(config["api_key"])
-                
-                # First sync
-                portfolio = client.get_portfolio(config["wallet_address"])
-                
-                if portfolio:
-                    st.spinner("Aguardando 5 segundos para validação de todos os protocolos (especialmente Revert Finance)...")
-                    time.sleep(5)
-                    # Second sync for validation
-                    portfolio = client.get_portfolio(config["wallet_address"])
-                
-                if not portfolio:
-                    st.error("❌ Falha ao buscar dados do portfólio. Verifique sua API key e endereço.")
-                    st.stop()
-                
-                st.success("✅ Sincronização manual concluída com dupla validação!")
-                
-                # Save data to session state
-                st.session_state.portfolio_data = portfolio
-                
-                # Get NAV value
-                nav_value = float(portfolio.get('networth', 0)) if portfolio.get('networth') else None
-                
-                # Save sync history WITH NAV value
-                config_mgr.add_sync_history({"manual_sync": True}, nav_value=nav_value)
-                
-                # Auto-quote: Create NAV snapshot automatically
-                if nav_value:
-                    # Check if a recent snapshot exists (within last 5 minutes)
-                    existing_snapshots = config_mgr.load_nav_snapshots()
-                    now = datetime.now()
-                    recent_duplicate = any(
-                        abs(snap["nav"] - nav_value) < 0.01 and 
-                        abs((datetime.fromisoformat(snap["timestamp"]) - now).total_seconds()) < 300
-                        for snap in existing_snapshots
-                    )
-                    
-                    if not recent_duplicate:
-                        config_mgr.add_nav_snapshot(nav_value)
-                        st.success("📈 Cotação registrada automaticamente!")
-
-        if 'portfolio_data' in st.session_state:
-            data = st.session_state.portfolio_data
-            
-            # Display current NAV
-            current_nav_value = float(data.get('networth', 0)) if data.get('networth') else 0
-            st.metric("💰 NAV Atual", f"${current_nav_value:,.2f}")
-            
-            # --- Executive Summary ---
-            networth = float(data.get("networth", "0"))
-            lp_value = float(data.get("total_lp_value", "0"))
-            hyperliquid_value = float(data.get("total_perp_value", "0"))
-            
-            lp_allocation_pct = (lp_value / networth * 100) if networth > 0 else 0
-            
-            client = OctavClient(config["api_key"])
-            all_lp_positions = client.extract_lp_positions(data)
-            perp_positions = client.extract_perp_positions(data)
-            
-            # Filter LP positions by enabled protocols
-            enabled_protocols = config.get("enabled_protocols", ["Revert", "Uniswap3", "Uniswap4", "Dhedge"])
-            lp_positions = [pos for pos in all_lp_positions if pos.protocol in enabled_protocols]
-            
-            lp_balances = {}
-            for pos in lp_positions:
-                symbol = OctavClient.normalize_symbol(pos.token_symbol)
-                lp_balances[symbol] = lp_balances.get(symbol, 0) + pos.balance
-            
-            short_balances = {}
-            for pos in perp_positions:
-                if pos.size < 0:
-                    symbol = OctavClient.normalize_symbol(pos.symbol)
-                    short_balances[symbol] = short_balances.get(symbol, 0) + abs(pos.size)
-            
-            hedge_value_threshold_pct = config.get("hedge_value_threshold_pct", 10.0)
-            
-            # Extract token prices (normalize symbols to match lp_balances keys)
-            token_prices = {}
-            for pos in lp_positions:
-                symbol = OctavClient.normalize_symbol(pos.token_symbol)
-                token_prices[symbol] = pos.price
-            
-            analyzer = DeltaNeutralAnalyzer(
-                hedge_value_threshold_pct=hedge_value_threshold_pct,
-                total_capital=networth
-            )
-            suggestions = analyzer.compare_positions(lp_balances, short_balances, token_prices)
-            
-            # Calculate hedge coverage and check if outside acceptable range
-            total_lp_value = sum(lp_balances.get(t, 0) * token_prices.get(t, 0) for t in lp_balances.keys())
-            total_short_value = sum(short_balances.get(t, 0) * token_prices.get(t, 0) for t in short_balances.keys())
-            
-            coverage_pct = (total_short_value / total_lp_value * 100) if total_lp_value > 0 else 0
-            coverage_trigger_activated = coverage_pct < 98.0 or coverage_pct > 102.0
-            
-            # If coverage trigger is activated, mark ALL suggestions with adjustments as required
-            if coverage_trigger_activated:
-                for s in suggestions:
-                    if s.action != "none":
-                        s.priority = "required"
-            
-            # --- Display Executive Summary Cards ---
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("💰 Patrimônio Líquido Total", f"${networth:,.2f}")
-            with col2:
-                st.metric("💼 Alocação Ideal (LPs)", f"{lp_allocation_pct:.1f}%", delta=f"{lp_allocation_pct-80:.1f}% vs 80%", delta_color="inverse")
-            with col3:
-                st.metric("⚖️ Hedge Delta-Neutral", f"{len(suggestions)} tokens", help="Número de tokens sendo monitorados para hedge.")
-            with col4:
-                st.metric("📉 Shorts Ativos", len(short_balances), help="Número de posições short na Hyperliquid.")
-
-            st.markdown("--- ")
-            
-            # --- Detailed Analysis ---
-            st.subheader("📊 Análise Detalhada")
-            
-            # Check if trigger is activated based on priority
-            trigger_activated = any(s.priority == "required" for s in suggestions)
-            
-            if trigger_activated:
-                trigger_reasons = []
-                if coverage_trigger_activated:
-                    trigger_reasons.append(f"Cobertura de hedge fora do range 98-102% (atual: {coverage_pct:.1f}%)")
-                if any(s.priority == "required" and s.adjustment_value_usd / networth * 100 >= hedge_value_threshold_pct for s in suggestions):
-                    trigger_reasons.append(f"Pelo menos uma posição tem ajuste maior que {hedge_value_threshold_pct}% do capital")
-                
-                trigger_text = " | ".join(trigger_reasons)
-                st.warning(f"⚡ **GATILHO DE REBALANCEAMENTO ACIONADO!** {trigger_text}. **TODAS as posições com desvio serão ajustadas**.")
-            else:
-                st.success(f"✅ Nenhuma posição requer ajuste obrigatório. Cobertura de hedge: {coverage_pct:.1f}% (range aceitável: 98-102%)")
-
-            # Display suggestions
-            if not suggestions:
-                st.info("✅ Nenhuma posição para analisar ou todas as posições estão perfeitamente balanceadas.")
-            else:
-                # Separate by status
-                balanced = [s for s in suggestions if s.status == "balanced"]
-                under_hedged = [s for s in suggestions if s.status == "under_hedged"]
-                over_hedged = [s for s in suggestions if s.status == "over_hedged"]
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("✅ Balanceadas", len(balanced))
-                with col2:
-                    st.metric("⚠️ Sub-Hedge", len(under_hedged))
-                with col3:
-                    st.metric("⚠️ Sobre-Hedge", len(over_hedged))
-            
-                st.markdown("---")
-
-                for s in sorted(suggestions, key=lambda x: x.priority, reverse=True):
-                    st.markdown(f"#### {s.token} - {s.status.upper().replace('_', ' ')}")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    
-                    lp_value_usd = s.lp_balance * token_prices.get(s.token, 0)
-                    short_value_usd = s.short_balance * token_prices.get(s.token, 0)
-                    diff_usd = s.difference * token_prices.get(s.token, 0)
-
-                    col1.metric("LP Balance", f"{s.lp_balance:.6f} {s.token}", f"${lp_value_usd:,.2f} USD")
-                    col2.metric("Short Balance", f"{s.short_balance:.6f} {s.token}", f"${short_value_usd:,.2f} USD")
-                    col3.metric("Diferença", f"{s.difference:+.6f} {s.token} ({s.difference_pct:.2f}%)", f"${diff_usd:+,.2f} USD")
-                
-                    if s.action != "none":
-                        action_text = "AUMENTAR" if s.action == "increase_short" else "DIMINUIR"
-                        
-                        # Show priority based on value threshold
-                        priority_emoji = "🔴" if s.priority == "required" else "🟡"
-                        priority_text = "OBRIGATÓRIO" if s.priority == "required" else "OPCIONAL"
-                        
-                        value_pct_of_capital = (s.adjustment_value_usd / networth * 100) if networth > 0 else 0
-                        
-                        st.info(f"{priority_emoji} **{priority_text}**: {action_text} SHORT em **{s.adjustment_amount:.6f} {s.token}** (${s.adjustment_value_usd:,.2f} = {value_pct_of_capital:.1f}% do capital)")
-
-                    st.markdown("<br>", unsafe_allow_html=True)
-
-            # --- Action Summary & Execution ---
-            st.subheader("📋 Resumo de Ações Necessárias")
-            
-            action_summary = analyzer.get_action_summary(suggestions)
-            increase_actions = action_summary.get("increase_short", {})
-            decrease_actions = action_summary.get("decrease_short", {})
-            
-            if not increase_actions and not decrease_actions:
-                st.success("✅ Nenhuma ação de hedge necessária no momento.")
-            else:
-                col1, col2 = st.columns(2)
-                with col1:
-                    if increase_actions:
-                        st.markdown("**🔺 AUMENTAR SHORT:**")
-                        for token, amount in increase_actions.items():
-                            st.markdown(f"- **{token}**: `+{amount:.6f}`")
-                with col2:
-                    if decrease_actions:
-                        st.markdown("**🔻 DIMINUIR SHORT:**")
-                        for token, amount in decrease_actions.items():
-                            st.markdown(f"- **{token}**: `-{amount:.6f}`")
-
-                st.subheader("⚡ Execução Automática")
-                st.warning("🚨 ATENÇÃO: Isso irá executar ordens reais na Hyperliquid!")
-                
-                if st.button("Executar Todos os Ajustes", key="exec_all"):
-                    hyperliquid_private_key = config.get("hyperliquid_private_key")
-                    if not hyperliquid_private_key:
-                        st.error("❌ Chave privada da Hyperliquid não configurada.")
-                        st.stop()
-                    
-                    with st.spinner("Executando ajustes na Hyperliquid..."):
-                        from hyperliquid_client import HyperliquidClient
-                        hl_client = HyperliquidClient(config["wallet_address"], hyperliquid_private_key)
-                        
-                        adjustments_to_exec = []
-                        for token, amount in increase_actions.items():
-                            adjustments_to_exec.append({"token": token, "action": "increase_short", "amount": amount})
-                        for token, amount in decrease_actions.items():
-                            adjustments_to_exec.append({"token": token, "action": "decrease_short", "amount": amount})
-                        
-                        results = hl_client.execute_adjustments(adjustments_to_exec)
-                        
-                        st.success("✅ Execução concluída!")
-                        
-                        # Log and display results
-                        for result in results:
-                            if result['result'].success:
-                                st.write(f"- **{result['token']}**: {result['action'].replace('_', ' ').title()} de {result['amount']:.6f} - ✅ SUCESSO (Ordem {result['result'].order_id})")
-                                config_mgr.add_execution_history({
-                                    'token': result['token'],
-                                    'action': result['action'],
-                                    'amount': result['amount'],
-                                    'order_value_usd': result.get('order_value_usd', 0),
-                                    'success': True,
-                                    'message': f"Order ID: {result['result'].order_id}",
-                                    'order_id': result['result'].order_id,
-                                    'filled_size': result['result'].filled_size,
-                                    'avg_price': result['result'].avg_price,
-                                    'auto_executed': False
-                                })
-                            else:
-                                st.write(f"- **{result['token']}**: {result['action'].replace('_', ' ').title()} de {result['amount']:.6f} - ❌ FALHA: {result['result'].message}")
-                                config_mgr.add_execution_history({
-                                    'token': result['token'],
-                                    'action': result['action'],
-                                    'amount': result['amount'],
-                                    'success': False,
-                                    'message': result['result'].message,
-                                    'auto_executed': False
-                                })
-
+        render_dashboard_tab()
+    
     # --- LP Positions Tab ---
     with tab_lp_positions:
         st.header("🏬 Posições LP")
         if 'portfolio_data' in st.session_state:
-            client = OctavClient(config["api_key"])
-            lp_positions = client.extract_lp_positions(st.session_state.portfolio_data)
+            lp_positions = st.session_state.lp_positions
             
             if not lp_positions:
                 st.info("Nenhuma posição LP encontrada.")
@@ -1112,12 +1260,16 @@ def main():
                 df_lp = pd.DataFrame([{
                     "Protocolo": pos.protocol,
                     "Token": pos.token_symbol,
-                    "Quantidade": f"{pos.balance:.6f}",
-                    "Preço USD": f"${pos.price:,.2f}",
-                    "Valor USD": f"${pos.value:,.2f}",
+                    "Quantidade": pos.balance,
+                    "Preço USD": pos.price,
+                    "Valor USD": pos.value,
                     "Tipo": pos.position_type
                 } for pos in lp_positions])
-                st.dataframe(df_lp, use_container_width=True)
+                st.dataframe(df_lp, use_container_width=True, hide_index=True, column_config={
+                    "Quantidade": st.column_config.NumberColumn(format="%.6f"),
+                    "Preço USD": st.column_config.NumberColumn(format="$%.2f"),
+                    "Valor USD": st.column_config.NumberColumn(format="$%.2f"),
+                })
 
                 st.markdown("---")
                 
@@ -1125,9 +1277,9 @@ def main():
                 st.subheader("🧀 Distribuição por Protocolo (Valor de Liquidação em USD)")
                 
                 # Aggregate by protocol
-                protocol_values = {}
+                protocol_values = defaultdict(float)
                 for pos in lp_positions:
-                    protocol_values[pos.protocol] = protocol_values.get(pos.protocol, 0) + pos.value
+                    protocol_values[pos.protocol] += pos.value
                 
                 if protocol_values:
                     import plotly.express as px
@@ -1166,12 +1318,15 @@ def main():
                         pct = (value / total_value * 100) if total_value > 0 else 0
                         protocol_table.append({
                             "Protocolo": protocol,
-                            "Valor USD": f"${value:,.2f}",
-                            "Percentual": f"{pct:.2f}%"
+                            "Valor USD": value,
+                            "Percentual": pct
                         })
                     
                     df_protocol_table = pd.DataFrame(protocol_table)
-                    st.dataframe(df_protocol_table, use_container_width=True)
+                    st.dataframe(df_protocol_table, use_container_width=True, hide_index=True, column_config={
+                        "Valor USD": st.column_config.NumberColumn(format="$%.2f"),
+                        "Percentual": st.column_config.NumberColumn(format="%.2f%%"),
+                    })
                     
                     st.metric("💰 Valor Total de Liquidação", f"${total_value:,.2f}")
                 
@@ -1179,13 +1334,12 @@ def main():
                 
                 # Aggregated balances by token
                 st.subheader("📊 Balanços Agregados por Token")
-                lp_balances = {}
-                for pos in lp_positions:
-                    symbol = OctavClient.normalize_symbol(pos.token_symbol)
-                    lp_balances[symbol] = lp_balances.get(symbol, 0) + pos.balance
+                lp_balances = st.session_state.lp_balances
                 
                 df_agg = pd.DataFrame(lp_balances.items(), columns=["Token", "Quantidade"])
-                st.dataframe(df_agg, use_container_width=True)
+                st.dataframe(df_agg, use_container_width=True, hide_index=True, column_config={
+                    "Quantidade": st.column_config.NumberColumn(format="%.6f"),
+                })
 
     # --- History Tab ---
     with tab_history:
@@ -1229,9 +1383,7 @@ def main():
             
             # Show full history table
             st.subheader("📊 Tabela de Sincronizações")
-            df_history = pd.DataFrame(history)
-            df_history['timestamp'] = pd.to_datetime(df_history['timestamp'])
-            st.dataframe(df_history, use_container_width=True)
+            render_history_table(history, "sync_history")
 
     # --- Executions Tab ---
     with tab_executions:
@@ -1240,10 +1392,7 @@ def main():
         if not executions:
             st.info("Nenhum histórico de execução encontrado.")
         else:
-            import pandas as pd
-            df_exec = pd.DataFrame(executions)
-            df_exec['timestamp'] = pd.to_datetime(df_exec['timestamp'])
-            st.dataframe(df_exec, use_container_width=True)
+            render_history_table(executions, "execution_history")
 
     # --- Proof of Reserves Tab ---
     with tab_proof_of_reserves:
@@ -1254,33 +1403,16 @@ def main():
             st.warning("⚠️ Por favor, execute 'Analisar Hedge' na aba Dashboard primeiro.")
         else:
             data = st.session_state.portfolio_data
-            client = OctavClient(config["api_key"])
-            
-            # Extract positions
-            lp_positions = client.extract_lp_positions(data)
-            perp_positions = client.extract_perp_positions(data)
-            
-            # Aggregate LP balances
-            lp_balances = {}
-            for pos in lp_positions:
-                symbol = OctavClient.normalize_symbol(pos.token_symbol)
-                lp_balances[symbol] = lp_balances.get(symbol, 0) + pos.balance
-            
-            # Aggregate short balances
-            short_balances = {}
-            for pos in perp_positions:
-                if pos.size < 0:
-                    symbol = OctavClient.normalize_symbol(pos.symbol)
-                    short_balances[symbol] = short_balances.get(symbol, 0) + abs(pos.size)
-            
-            # Extract token prices
-            token_prices = {}
-            for pos in lp_positions:
-                symbol = OctavClient.normalize_symbol(pos.token_symbol)
-                token_prices[symbol] = pos.price
-            
-            # Get all tokens
-            all_tokens = set(lp_balances.keys()) | set(short_balances.keys())
+            
+            # Positions extracted when the portfolio was fetched
+            lp_positions = st.session_state.lp_positions
+            perp_positions = st.session_state.perp_positions
+            
+            # Balances, prices and the sorted token list computed at fetch time
+            lp_balances = st.session_state.lp_balances
+            short_balances = st.session_state.short_balances
+            token_prices = st.session_state.token_prices
+            all_tokens = st.session_state.hedge_tokens
             
             if not all_tokens:
                 st.info("✅ Nenhuma posição encontrada para validar.")
@@ -1366,12 +1498,15 @@ def main():
                         pct = (value / total_portfolio_value * 100) if total_portfolio_value > 0 else 0
                         protocol_table.append({
                             "Protocolo": protocol,
-                            "Valor USD": f"${value:,.2f}",
-                            "% do Total": f"{pct:.2f}%"
+                            "Valor USD": value,
+                            "% do Total": pct
                         })
                     
                     df_protocol_table = pd.DataFrame(protocol_table)
-                    st.dataframe(df_protocol_table, use_container_width=True)
+                    st.dataframe(df_protocol_table, use_container_width=True, hide_index=True, column_config={
+                        "Valor USD": st.column_config.NumberColumn(format="$%.2f"),
+                        "% do Total": st.column_config.NumberColumn(format="%.2f%%"),
+                    })
                     
                     st.metric("💰 Valor Total do Portfólio", f"${total_portfolio_value:,.2f}")
                     st.caption(f"📊 Inclui {len([p for p in protocol_values.keys() if p != 'Hyperliquid'])} protocolos LP + Hyperliquid")
@@ -1381,43 +1516,53 @@ def main():
                 # --- Detailed Breakdown ---
                 st.subheader("📊 Detalhamento por Token")
                 
-                proof_data = []
-                for token in sorted(all_tokens):
-                    lp_bal = lp_balances.get(token, 0)
-                    short_bal = short_balances.get(token, 0)
-                    price = token_prices.get(token, 0)
-                    
-                    lp_value = lp_bal * price
-                    short_value = short_bal * price
-                    
-                    if lp_value > 0:
-                        token_coverage = (short_value / lp_value) * 100
-                    else:
-                        token_coverage = 0 if short_value == 0 else 999  # Over-hedged with no LP
-                    
-                    # Determine status
-                    if 95 <= token_coverage <= 105:
-                        status = "✅ Adequado"
-                    elif 90 <= token_coverage <= 110:
-                        status = "🟡 Aceitável"
-                    elif token_coverage < 90:
-                        status = "⚠️ Sub-Hedge"
-                    else:
-                        status = "🔴 Sobre-Hedge"
+                # The table only changes when the portfolio is fetched again, so it is
+                # built once per fetch and reused on reruns
+                if "proof_table" not in st.session_state:
+                    proof_data = []
+                    for token in all_tokens:
+                        lp_bal = lp_balances.get(token, 0)
+                        short_bal = short_balances.get(token, 0)
+                        price = token_prices.get(token, 0)
+                        
+                        lp_value = lp_bal * price
+                        short_value = short_bal * price
+                        
+                        if lp_value > 0:
+                            token_coverage = (short_value / lp_value) * 100
+                        else:
+                            token_coverage = 0 if short_value == 0 else 999  # Over-hedged with no LP
+                        
+                        # Determine status
+                        if 95 <= token_coverage <= 105:
+                            status = "✅ Adequado"
+                        elif 90 <= token_coverage <= 110:
+                            status = "🟡 Aceitável"
+                        elif token_coverage < 90:
+                            status = "⚠️ Sub-Hedge"
+                        else:
+                            status = "🔴 Sobre-Hedge"
+                        
+                        proof_data.append({
+                            "Token": token,
+                            "LP Balance": lp_bal,
+                            "Short Balance": short_bal,
+                            "LP Value (USD)": lp_value,
+                            "Short Value (USD)": short_value,
+                            "Cobertura": token_coverage,
+                            "Status": status
+                        })
                     
-                    proof_data.append({
-                        "Token": token,
-                        "LP Balance": f"{lp_bal:.6f}",
-                        "Short Balance": f"{short_bal:.6f}",
-                        "LP Value (USD)": f"${lp_value:,.2f}",
-                        "Short Value (USD)": f"${short_value:,.2f}",
-                        "Cobertura": f"{token_coverage:.1f}%",
-                        "Status": status
-                    })
-                
-                import pandas as pd
-                df_proof = pd.DataFrame(proof_data)
-                st.dataframe(df_proof, use_container_width=True)
+                    import pandas as pd
+                    st.session_state.proof_table = pd.DataFrame(proof_data)
+                df_proof = st.session_state.proof_table
+                st.dataframe(df_proof, use_container_width=True, hide_index=True, column_config={
+                    "LP Balance": st.column_config.NumberColumn(format="%.6f"),
+                    "Short Balance": st.column_config.NumberColumn(format="%.6f"),
+                    "LP Value (USD)": st.column_config.NumberColumn(format="$%.2f"),
+                    "Short Value (USD)": st.column_config.NumberColumn(format="$%.2f"),
+                    "Cobertura": st.column_config.NumberColumn(format="%.1f%%"),
+                })
                 
                 st.markdown("---")
                 
@@ -1427,22 +1572,29 @@ def main():
                 if not perp_positions:
                     st.info("Nenhuma posição perpétua encontrada na Hyperliquid.")
                 else:
+                    import pandas as pd
                     df_perp = pd.DataFrame([{
                         "Token": pos.symbol,
-                        "Tamanho": f"{pos.size:.6f}",
-                        "Preço Marca": f"${pos.mark_price:,.2f}",
-                        "Valor USD": f"${pos.position_value:,.2f}",
-                        "P&L": f"${pos.open_pnl:,.2f}",
-                        "Margem": f"${pos.margin_used:,.2f}",
+                        "Tamanho": pos.size,
+                        "Preço Marca": pos.mark_price,
+                        "Valor USD": pos.position_value,
+                        "P&L": pos.open_pnl,
+                        "Margem": pos.margin_used,
                         "Alavancagem": pos.leverage
                     } for pos in perp_positions])
-                    st.dataframe(df_perp, use_container_width=True)
+                    st.dataframe(df_perp, use_container_width=True, hide_index=True, column_config={
+                        "Tamanho": st.column_config.NumberColumn(format="%.6f"),
+                        "Preço Marca": st.column_config.NumberColumn(format="$%.2f"),
+                        "Valor USD": st.column_config.NumberColumn(format="$%.2f"),
+                        "P&L": st.column_config.NumberColumn(format="$%.2f"),
+                        "Margem": st.column_config.NumberColumn(format="$%.2f"),
+                    })
                 
                 st.markdown("---")
                 
                 # --- Public Verification Link ---
                 st.subheader("🔗 Verificação Pública")
-                wallet_address = config.get("wallet_address", "")
+                wallet_address = (get_active_config() or {}).get("wallet_address", "")
                 if wallet_address:
                     hyperliquid_link = f"https://app.hyperliquid.xyz/explorer/{wallet_address}"
                     st.markdown(f"🔍 **Verificar posições na Hyperliquid:** [{wallet_address}]({hyperliquid_link})")
@@ -1547,6 +1699,7 @@ def main():
                 ]
             }
             
+            import pandas as pd
             df_ranges = pd.DataFrame(ranges_data)
             st.table(df_ranges)
             
@@ -1555,6 +1708,9 @@ def main():
     # --- Footer ---
     st.markdown("---")
     st.markdown("XCELFI LP Hedge V3 | Powered by Octav.fi API | Mode: Analysis (Read-Only)")
+    # Stamped when the portfolio was fetched, so the footer is identical across reruns
+    if 'fetched_at' in st.session_state:
+        st.caption(f"Dados do portfólio de {st.session_state.fetched_at}")
     st.markdown("Made with [Streamlit](https://streamlit.io)")
 
 if __name__ == "__main__":
@@ -3,14 +3,12 @@ XCELFI LP Hedge - Main Streamlit Application
 Delta Neutral LP Hedge Strategy with Aerodrome + Hyperliquid
 """
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 import pandas as pd
 
 # Import core modules
 from core.config import config
-from core.auth import AuthManager, render_login_page
+from core.auth import get_auth_manager, render_login_page
 from core.nav import NAVCalculator
 from core.triggers import TriggerMonitor
 from core.safety import SafetyChecker
@@ -39,6 +37,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Check authentication before any per-session setup, so the login page
+# rerun does not build calculators or load settings
+auth_manager = get_auth_manager(tuple(sorted(config.auth_users.items())))
+
+if not auth_manager.is_authenticated():
+    render_login_page(auth_manager)
+    st.stop()
+
 # Initialize session state
 if 'initialized' not in st.session_state:
     st.session_state.initialized = False
@@ -56,14 +62,6 @@ if 'initialized' not in st.session_state:
     st.session_state.pnl_tracker = PnLTracker()
     st.session_state.auto_mode_enabled = user_settings.get('auto_execute_enabled', False)
 
-# Initialize auth manager
-auth_manager = AuthManager(config.auth_users)
-
-# Check authentication
-if not auth_manager.is_authenticated():
-    render_login_page(auth_manager)
-    st.stop()
-
 # Initialize clients
 @st.cache_resource
 def init_clients():
@@ -88,6 +86,27 @@ def init_clients():
 
 aerodrome_client, hyperliquid_client = init_clients()
 
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_account_data(wallet_address, pool_address, _aerodrome, _hyperliquid):
+    """
+    Fetch LP position, wallet balances, Hyperliquid state and funding (cached),
+    plus the time they were fetched.
+    
+    Keyed on the wallet and pool the clients were built for (the clients
+    themselves aren't hashable); reruns within the TTL skip the network
+    entirely. Clear it after anything that changes the account state.
+    """
+    return (
+        _aerodrome.get_lp_position(),
+        _aerodrome.get_balances(),
+        _hyperliquid.get_state(),
+        _hyperliquid.get_funding_info("BTC/USDC"),
+        _hyperliquid.get_funding_info("ETH/USDC"),
+        datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    )
+
+
 # Initialize strategy components
 safety_checker = SafetyChecker(config)
 log_manager = LogManager()
@@ -114,7 +133,8 @@ with st.sidebar:
     st.markdown("---")
     
     # User info
-    current_user = auth_manager.get_current_user()
+    # Already validated by the auth gate above
+    current_user = st.session_state.get('username')
     st.write(f"👤 **User:** {current_user}")
     
     if st.button("🚪 Logout"):
@@ -145,30 +165,34 @@ with st.sidebar:
     
     # Refresh button
     if st.button("🔄 Refresh Data"):
+        load_account_data.clear()
         st.rerun()
 
-# Main content - Create tabs
-main_tabs = st.tabs(["📊 Dashboard", "⚙️ Configurações"])
+# Main content - page selector. Unlike st.tabs, only the selected page's
+# widgets are built and sent to the browser on each rerun
+active_tab = st.radio(
+    "Page",
+    ["📊 Dashboard", "⚙️ Configurações"],
+    key="active_tab",
+    horizontal=True,
+    label_visibility="collapsed"
+)
 
 # TAB 1: DASHBOARD
-with main_tabs[0]:
+if active_tab == "📊 Dashboard":
     st.title("📊 Delta Neutral LP Hedge Dashboard")
     
     # Get current data
     try:
-        # Get LP position
-        lp_position = aerodrome_client.get_lp_position()
-        
-        # Get balances
-        balances = aerodrome_client.get_balances()
-        
-        # Get Hyperliquid positions
-        hl_positions = hyperliquid_client.get_positions()
-        hl_balance = hyperliquid_client.get_balance()
+        # Get LP position, balances, Hyperliquid state and funding info
+        lp_position, balances, hl_state, btc_funding, eth_funding, fetched_at = load_account_data(
+            config.wallet_public_address, config.aerodrome_pool_address,
+            aerodrome_client, hyperliquid_client
+        )
         
-        # Get funding info
-        btc_funding = hyperliquid_client.get_funding_info("BTC/USDC")
-        eth_funding = hyperliquid_client.get_funding_info("ETH/USDC")
+        # Hyperliquid positions and balance (one clearinghouse request)
+        hl_positions = hyperliquid_client.parse_positions(hl_state)
+        hl_balance = hyperliquid_client.parse_balance(hl_state)
         
         # Mock prices
         eth_price = 2500.0
@@ -313,6 +337,11 @@ with main_tabs[0]:
     # Allocation breakdown
     st.subheader("📈 Allocation Breakdown")
     
+    # Plotly is only needed for these charts; importing it here keeps it
+    # off the login page rerun
+    import plotly.graph_objects as go
+    import plotly.express as px
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
@@ -501,6 +530,8 @@ with main_tabs[0]:
                             if result['success']:
                                 st.success("✅ Rebalance executed successfully!")
                                 st.session_state.trigger_monitor.mark_recentered()
+                                # Positions changed: never show (and re-offer) the pre-trade state
+                                load_account_data.clear()
                                 st.rerun()
                             else:
                                 st.error(f"❌ Error: {result['error']}")
@@ -511,6 +542,7 @@ with main_tabs[0]:
                             result = executor.execute_manual(recenter_plan, lp_position, "lp_only")
                             if result['success']:
                                 st.success("✅ LP recenter executed successfully!")
+                                load_account_data.clear()
                                 st.rerun()
                             else:
                                 st.error(f"❌ Error: {result['error']}")
@@ -521,6 +553,7 @@ with main_tabs[0]:
                             result = executor.execute_manual(recenter_plan, lp_position, "shorts_only")
                             if result['success']:
                                 st.success("✅ Shorts adjusted successfully!")
+                                load_account_data.clear()
                                 st.rerun()
                             else:
                                 st.error(f"❌ Error: {result['error']}")
@@ -542,13 +575,17 @@ with main_tabs[0]:
         recent_executions = log_manager.get_recent_executions(limit=10)
         
         if recent_executions:
-            for log in reversed(recent_executions):
-                timestamp = log.get('timestamp', 'N/A')
-                event = log.get('event', 'N/A')
-                operation = log.get('operation_type', 'N/A')
-                mode = log.get('mode', 'N/A')
-                
-                st.write(f"**{timestamp}** - {event} - {operation} ({mode})")
+            # One table instead of one markdown element per log entry
+            st.dataframe(
+                pd.DataFrame([{
+                    "Timestamp": log.get('timestamp', 'N/A'),
+                    "Event": log.get('event', 'N/A'),
+                    "Operation": log.get('operation_type', 'N/A'),
+                    "Mode": log.get('mode', 'N/A')
+                } for log in reversed(recent_executions)]),
+                use_container_width=True,
+                hide_index=True
+            )
         else:
             st.info("No execution logs yet")
     
@@ -556,19 +593,23 @@ with main_tabs[0]:
         recent_errors = log_manager.get_recent_errors(limit=10)
         
         if recent_errors:
-            for log in reversed(recent_errors):
-                timestamp = log.get('timestamp', 'N/A')
-                error = log.get('error', 'N/A')
-                operation = log.get('operation_type', 'N/A')
-                
-                st.error(f"**{timestamp}** - {operation}: {error}")
+            st.error(f"{len(recent_errors)} recent error(s)")
+            st.dataframe(
+                pd.DataFrame([{
+                    "Timestamp": log.get('timestamp', 'N/A'),
+                    "Operation": log.get('operation_type', 'N/A'),
+                    "Error": log.get('error', 'N/A')
+                } for log in reversed(recent_errors)]),
+                use_container_width=True,
+                hide_index=True
+            )
         else:
             st.success("No errors logged")
     
         # Footer
         st.markdown("---")
-        st.caption(f"XCELFI LP Hedge v2.0 | Mode: {config.operation_mode} | Last refresh: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        st.caption(f"XCELFI LP Hedge v2.0 | Mode: {config.operation_mode} | Last refresh: {fetched_at}")
     
 # TAB 2: CONFIGURAÇÕES
-with main_tabs[1]:
+else:
     render_settings_tab(st.session_state.settings_manager)
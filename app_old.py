@@ -1,17 +1,20 @@
 """
 XCELFI LP Hedge - Simplified Working Version
 """
+import asyncio
+import hashlib
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
-import plotly.graph_objects as go
+import pandas as pd
+from dataclasses import asdict
 from datetime import datetime
 
 # Import core modules
 from core.config import config
 from core.settings_manager import SettingsManager
 from integrations.hyperliquid import HyperliquidClient
-from integrations.uniswap import UniswapClient
-from integrations.octav import OctavClient
-from core.delta_neutral import DeltaNeutralAnalyzer
 
 # Page configuration
 st.set_page_config(
@@ -21,11 +24,244 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize settings manager
-if 'settings_manager' not in st.session_state:
-    st.session_state.settings_manager = SettingsManager()
+# Stateless helpers - one instance per process, shared by all sessions
+@st.cache_resource
+def get_settings_manager():
+    """Get the shared settings manager"""
+    return SettingsManager()
 
-settings_manager = st.session_state.settings_manager
+
+@st.cache_resource
+def get_analyzer(tolerance_pct):
+    """Get a shared delta neutral analyzer"""
+    # Imported lazily - pulls in numpy and is only needed once positions load
+    from core.delta_neutral import DeltaNeutralAnalyzer
+    return DeltaNeutralAnalyzer(tolerance_pct=tolerance_pct)
+
+
+settings_manager = get_settings_manager()
+
+# Fallbacks for settings that were never saved (read from config once per process)
+SETTINGS_DEFAULTS = {
+    "wallet_public_address": config.wallet_public_address,
+    "hyperliquid_api_key": config.hyperliquid_api_key or "",
+    "hyperliquid_api_secret": config.hyperliquid_api_secret or "",
+    "use_octav": True,
+    "octav_api_key": "",
+    "graph_api_key": "",
+    "uniswap_networks": ["base", "arbitrum", "ethereum", "optimism", "polygon"],
+}
+
+
+def set_settings(settings):
+    """Store saved settings and the effective view (saved over defaults) in the session"""
+    st.session_state.settings = settings
+    st.session_state.effective_settings = {**SETTINGS_DEFAULTS, **settings}
+
+
+# Load settings once per session; refreshed only after a successful save
+if 'settings' not in st.session_state:
+    set_settings(settings_manager.load_settings())
+
+
+# Shared API clients - built once per credential set and reused across
+# reruns and sessions
+@st.cache_resource
+def get_http_session():
+    """Get the HTTP session (connection pool) shared by all API clients"""
+    session = requests.Session()
+    # Pool sized for the parallel subgraph queries; transient rate-limit and
+    # gateway errors are retried with backoff. All POSTs here are read-only
+    # queries, so they are safe to retry too.
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"})
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_hl_client(base_url, wallet, key, secret):
+    """Get a shared Hyperliquid client"""
+    return HyperliquidClient(
+        base_url=base_url,
+        wallet_address=wallet,
+        api_key=key,
+        api_secret=secret,
+        session=get_http_session()
+    )
+
+
+@st.cache_resource
+def get_uni_client(wallet, networks, graph_api_key):
+    """Get a shared Uniswap client"""
+    # Imported lazily - only needed when Octav.fi is not in use
+    from integrations.uniswap import UniswapClient
+    return UniswapClient(
+        wallet_address=wallet,
+        networks=list(networks),
+        graph_api_key=graph_api_key,
+        session=get_http_session()
+    )
+
+
+
+@st.cache_resource
+def get_octav_client(api_key):
+    """Get a shared Octav.fi client"""
+    # Imported lazily - only needed when Octav.fi is in use
+    from integrations.octav import OctavClient
+    return OctavClient(api_key=api_key, session=get_http_session())
+
+
+# (label, balance key) pairs shown as metrics on the dashboard
+BALANCE_METRICS = (
+    ("Account Value", "total_equity"),
+    ("Available", "available_balance"),
+    ("Margin Used", "margin_used"),
+    ("Unrealized PnL", "unrealized_pnl"),
+)
+
+
+# Position table formats - numbers stay numeric and are formatted by the
+# frontend (printf-style), so no per-cell string building on rerun
+HL_POSITION_COLUMNS = {
+    "Size": st.column_config.NumberColumn(format="%.6f"),
+    "Entry Price": st.column_config.NumberColumn(format="$%.2f"),
+    "Mark Price": st.column_config.NumberColumn(format="$%.2f"),
+    "Leverage": st.column_config.NumberColumn(format="%.1fx"),
+    "Position Value": st.column_config.NumberColumn(format="$%.2f"),
+    "Unrealized PnL": st.column_config.NumberColumn(format="$%.2f"),
+    "Margin": st.column_config.NumberColumn(format="$%.2f"),
+}
+
+UNI_POSITION_COLUMNS = {
+    "Token0 Amount": st.column_config.NumberColumn(format="%.6f"),
+    "Token1 Amount": st.column_config.NumberColumn(format="%.6f"),
+    "Value USD": st.column_config.NumberColumn(format="$%.2f"),
+    "Uncollected Fees": st.column_config.NumberColumn(format="$%.2f"),
+}
+
+
+SUGGESTION_LABELS = {
+    "balanced": "✅ Balanced",
+    "increase_short": "⚠️ Increase short",
+    "decrease_short": "⚠️ Decrease short",
+}
+
+
+# Cached data fetchers - only primitive credentials are passed in so the
+# cache key stays hashable and reruns within the TTL skip the network.
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_hl_state(wallet, key, secret, base_url):
+    """
+    Fetch Hyperliquid clearinghouse state (cached) and the time it was fetched.
+    
+    Balance and positions are both derived from this single response.
+    """
+    # Formatted here so cached reruns reuse the string instead of re-formatting
+    fetched_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return get_hl_client(base_url, wallet, key, secret).get_state(), fetched_at
+
+
+# LP positions only change on deposit/withdraw/rebalance, so they are
+# cached on disk (surviving restarts) until Refresh or a settings save
+# clears them; the key has no time component, so entries stay bounded.
+@st.cache_data(persist="disk", max_entries=64, show_spinner=False)
+def _fetch_uni_positions(wallet, networks, graph_api_key):
+    """Fetch Uniswap V3 positions across networks (cached on disk)"""
+    return get_uni_client(wallet, networks, graph_api_key).get_positions()
+
+
+def _to_dict(pos):
+    """Return an LP position as a plain dict (dataclasses are converted)"""
+    return pos if isinstance(pos, dict) else asdict(pos)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_octav_positions(wallet, api_key_hash, _api_key):
+    """
+    Fetch LP positions via Octav.fi (cached).
+    
+    Keyed on a SHA-256 of the API key; the raw key is excluded from the cache key.
+    """
+    return get_octav_client(_api_key).get_positions(wallet)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _analyze_delta_neutral(lp_rows, short_rows, tolerance_pct):
+    """
+    Compare LP token exposure with Hyperliquid shorts (cached).
+    
+    lp_rows holds (token0_symbol, token0_amount, token1_symbol, token1_amount)
+    tuples and short_rows (coin, size) tuples, so the cache key is the
+    positions themselves and reruns with unchanged positions skip the analysis.
+    """
+    analyzer = get_analyzer(tolerance_pct)
+    
+    lp_token_positions = analyzer.extract_lp_positions([
+        {'token0_symbol': t0, 'token0_amount': a0, 'token1_symbol': t1, 'token1_amount': a1}
+        for t0, a0, t1, a1 in lp_rows
+    ])
+    short_positions = analyzer.extract_short_positions([
+        {'coin': coin, 'szi': size} for coin, size in short_rows
+    ])
+    
+    return analyzer.compare_positions(lp_token_positions, short_positions)
+
+
+def clear_data_caches():
+    """Drop cached API responses so the next render fetches fresh data"""
+    _fetch_hl_state.clear()
+    _fetch_uni_positions.clear()
+    _fetch_octav_positions.clear()
+    # The last analysis was computed from the data being dropped
+    st.session_state.pop("dn_result", None)
+
+
+async def _load_dashboard_data(wallet, key, secret, base_url, networks, graph_api_key, octav_api_key,
+                               on_loaded=None):
+    """
+    Fetch Hyperliquid account state and LP positions concurrently.
+
+    The clients are blocking, so each fetch runs in a worker thread and the
+    wall time becomes the slowest call instead of the sum. Failures are
+    returned in place of the result so each section can report its own error.
+    LP positions come from Octav.fi when octav_api_key is set, otherwise
+    from the Uniswap subgraphs of the given networks (none are queried when
+    networks is empty). on_loaded(name) is called as each source finishes,
+    in completion order.
+    """
+    async def _load(name, func, *args):
+        try:
+            result = await asyncio.to_thread(func, *args)
+        except Exception as e:
+            result = e
+        if on_loaded:
+            on_loaded(name)
+        return result
+
+    if octav_api_key:
+        api_key_hash = hashlib.sha256(octav_api_key.encode()).hexdigest()
+        lp_task = _load("Octav.fi positions", _fetch_octav_positions, wallet, api_key_hash, octav_api_key)
+    elif networks:
+        lp_task = _load("Uniswap positions", _fetch_uni_positions, wallet, networks, graph_api_key)
+    else:
+        # Every configured network was filtered out - nothing to query
+        lp_task = asyncio.sleep(0, result=[])
+
+    return await asyncio.gather(
+        _load("Hyperliquid account", _fetch_hl_state, wallet, key, secret, base_url),
+        lp_task
+    )
 
 # Sidebar
 with st.sidebar:
@@ -46,69 +282,66 @@ with st.sidebar:
 # Main content
 st.title("📊 Delta Neutral LP Hedge Dashboard")
 
-# Create tabs
-main_tabs = st.tabs(["📊 Dashboard", "⚙️ Configurações"])
+# Tab selector - unlike st.tabs, only the selected page's widgets are
+# built and sent to the browser on each rerun
+active_tab = st.radio(
+    "Page",
+    ["📊 Dashboard", "⚙️ Configurações"],
+    key="active_tab",
+    horizontal=True,
+    label_visibility="collapsed"
+)
 
 # TAB 1: DASHBOARD
-with main_tabs[0]:
+# Each section is its own fragment, so a widget inside one (row selection,
+# analysis button) reruns only that section instead of the whole dashboard.
+# The position sections publish their parsed positions to session_state for
+# the Delta Neutral section.
+@st.fragment
+def hyperliquid_section(state_result):
+    """Render Hyperliquid balance and positions from the fetched state"""
     st.subheader("Hyperliquid Positions")
     
-    # Load saved settings
-    saved_settings = settings_manager.load_settings()
-    
-    # Use saved settings if available, otherwise use config defaults
-    wallet_addr = saved_settings.get("wallet_public_address", config.wallet_public_address)
-    hl_key = saved_settings.get("hyperliquid_api_key", config.hyperliquid_api_key)
-    hl_secret = saved_settings.get("hyperliquid_api_secret", config.hyperliquid_api_secret)
+    # Defined up front so the Delta Neutral section can run even if the fetch failed
+    positions = []
     
-    # Initialize Hyperliquid client
     try:
-        hyperliquid_client = HyperliquidClient(
-            base_url=config.hyperliquid_base_url,
-            wallet_address=wallet_addr,
-            api_key=hl_key,
-            api_secret=hl_secret
-        )
+        if isinstance(state_result, Exception):
+            raise state_result
+        
+        state, fetched_at = state_result
+        st.session_state.data_fetched_at = fetched_at
         
-        # Get balance
-        balance = hyperliquid_client.get_balance()
+        # Balance and positions come from the same clearinghouse state
+        balance = HyperliquidClient.parse_balance(state)
+        positions = HyperliquidClient.parse_positions(state)
         
         if balance:
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Account Value", f"${balance.get('total_equity', 0):.2f}")
-            
-            with col2:
-                st.metric("Available", f"${balance.get('available_balance', 0):.2f}")
-            
-            with col3:
-                st.metric("Margin Used", f"${balance.get('margin_used', 0):.2f}")
-            
-            with col4:
-                st.metric("Unrealized PnL", f"${balance.get('unrealized_pnl', 0):.2f}")
+            for col, (label, key) in zip(st.columns(len(BALANCE_METRICS), gap="small"), BALANCE_METRICS):
+                col.metric(label, f"${balance.get(key, 0):.2f}")
             
             st.markdown("---")
         
-        # Get positions
-        positions = hyperliquid_client.get_positions()
-        
         if positions:
             st.write(f"**Open Positions:** {len(positions)}")
             
-            for pos in positions:
-                with st.expander(f"{pos.symbol} - Size: {pos.size:.6f}"):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write(f"**Entry Price:** ${pos.entry_price:,.2f}")
-                        st.write(f"**Mark Price:** ${pos.mark_price:,.2f}")
-                        st.write(f"**Leverage:** {pos.leverage}x")
-                    
-                    with col2:
-                        st.write(f"**Position Value:** ${abs(pos.size * pos.mark_price):,.2f}")
-                        st.write(f"**Unrealized PnL:** ${pos.unrealized_pnl:.2f}")
-                        st.write(f"**Margin:** ${pos.margin:.2f}")
+            # Render all positions as a single table
+            df_positions = pd.DataFrame([{
+                "Symbol": pos.symbol,
+                "Size": pos.size,
+                "Entry Price": pos.entry_price,
+                "Mark Price": pos.mark_price,
+                "Leverage": pos.leverage,
+                "Unrealized PnL": pos.unrealized_pnl,
+                "Margin": pos.margin
+            } for pos in positions])
+            df_positions.insert(5, "Position Value", (df_positions["Size"] * df_positions["Mark Price"]).abs())
+            st.dataframe(
+                df_positions,
+                use_container_width=True,
+                hide_index=True,
+                column_config=HL_POSITION_COLUMNS
+            )
         else:
             st.info("No open positions found")
     
@@ -116,97 +349,71 @@ with main_tabs[0]:
         st.error(f"Error loading Hyperliquid data: {e}")
         st.info("Make sure you have configured your wallet address in Settings")
     
-    st.markdown("---")
-    st.markdown("---")
-    
-    # UNISWAP V3 POSITIONS
+    st.session_state.hl_positions = positions
+
+
+@st.fragment
+def uniswap_section(lp_result, via_octav, configured_networks, skipped_networks=()):
+    """Render Uniswap V3 LP positions from the fetched LP source"""
     st.subheader("Uniswap V3 LP Positions (Multi-Network)")
     
+    if skipped_networks:
+        st.warning(f"Skipped networks that require a The Graph API key: {', '.join(skipped_networks)}")
+    
+    # Defined up front so the Delta Neutral section can run even if the fetch failed
+    uni_positions = []
+    
     try:
-        # Check if Octav.fi should be used
-        use_octav = saved_settings.get("use_octav", True)
-        octav_api_key = saved_settings.get("octav_api_key", "")
+        if via_octav:
+            st.caption("📡 Positions fetched via Octav.fi API")
         
-        uni_positions = []
-        configured_networks = saved_settings.get("uniswap_networks", ["base", "arbitrum", "ethereum", "optimism", "polygon"])
-        
-        if use_octav and octav_api_key:
-            # Use Octav.fi API
-            st.info("📡 Fetching positions via Octav.fi API...")
-            octav_client = OctavClient(api_key=octav_api_key)
-            octav_positions = octav_client.get_positions(wallet_addr)
-            
-            # Convert Octav positions to our format
-            # (Octav returns dict, we need to convert to Position objects or use dict directly)
-            uni_positions = octav_positions
-        else:
-            # Use direct Subgraph queries
-            graph_api_key = saved_settings.get("graph_api_key", "")
-            
-            uniswap_client = UniswapClient(
-                wallet_address=wallet_addr,
-                networks=configured_networks,
-                graph_api_key=graph_api_key if graph_api_key else None
-            )
-            
-            # Get positions
-            uni_positions = uniswap_client.get_positions()
+        # Fetched by render_dashboard, concurrently with Hyperliquid
+        if isinstance(lp_result, Exception):
+            raise lp_result
+        # Normalize once: Octav.fi returns dicts, subgraphs return dataclasses
+        uni_positions = [_to_dict(pos) for pos in lp_result]
         
         if uni_positions:
-            # Handle both dict and object formats
+            uni_rows = []
             networks = set()
-            for p in uni_positions:
-                if isinstance(p, dict):
-                    networks.add(p.get('network', 'Unknown'))
-                else:
-                    networks.add(p.network)
+            for pos in uni_positions:
+                network = pos.get('network', 'Unknown')
+                networks.add(network)
+                uni_rows.append({
+                    "Status": "✅ In Range" if pos.get('in_range', True) else "⚠️ Out of Range",
+                    "Network": network,
+                    "Pair": f"{pos.get('token0_symbol', '')}/{pos.get('token1_symbol', '')}",
+                    "Fee (%)": pos.get('fee_tier', ''),
+                    "Token0 Amount": pos.get('token0_amount', 0),
+                    "Token1 Amount": pos.get('token1_amount', 0),
+                    "Liquidity": pos.get('liquidity', 0),
+                    "Value USD": pos.get('value_usd', 0),
+                    "Uncollected Fees": pos.get('uncollected_fees_usd', 0),
+                    "Position ID": pos.get('id', '')
+                })
             
-            st.write(f"**Active LP Positions:** {len(uni_positions)} across {len(networks)} network(s)")
+            df_uni = pd.DataFrame(uni_rows)
+            st.write(f"**Active LP Positions:** {len(df_uni)} across {len(networks)} network(s)")
             
-            for pos in uni_positions:
-                # Support both dict and object
-                if isinstance(pos, dict):
-                    in_range = pos.get('in_range', True)
-                    network = pos.get('network', 'Unknown')
-                    token0 = pos.get('token0_symbol', '')
-                    token1 = pos.get('token1_symbol', '')
-                    fee_tier = pos.get('fee_tier', '')
-                    token0_amt = pos.get('token0_amount', 0)
-                    token1_amt = pos.get('token1_amount', 0)
-                    liquidity = pos.get('liquidity', 0)
-                    value_usd = pos.get('value_usd', 0)
-                    uncollected_fees = pos.get('uncollected_fees_usd', 0)
-                    pos_id = pos.get('id', '')
-                else:
-                    in_range = pos.in_range
-                    network = pos.network
-                    token0 = pos.token0_symbol
-                    token1 = pos.token1_symbol
-                    fee_tier = pos.fee_tier
-                    token0_amt = pos.token0_amount
-                    token1_amt = pos.token1_amount
-                    liquidity = pos.liquidity
-                    value_usd = getattr(pos, 'value_usd', 0)
-                    uncollected_fees = getattr(pos, 'uncollected_fees_usd', 0)
-                    pos_id = pos.id
-                
-                status_emoji = "✅" if in_range else "⚠️"
-                with st.expander(f"{status_emoji} [{network}] {token0}/{token1} - Fee: {fee_tier}%"):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write(f"**{token0} Amount:** {token0_amt:.6f}")
-                        st.write(f"**{token1} Amount:** {token1_amt:.6f}")
-                        st.write(f"**Liquidity:** {liquidity:,.0f}")
-                        if value_usd > 0:
-                            st.write(f"**Value USD:** ${value_usd:,.2f}")
-                    
-                    with col2:
-                        if uncollected_fees > 0:
-                            st.write(f"**Uncollected Fees:** ${uncollected_fees:.2f}")
-                        st.write(f"**Status:** {'In Range' if in_range else 'Out of Range'}")
-                    
-                    st.caption(f"Position ID: {pos_id}")
+            # Render all LP positions as a single table; full details are only
+            # built for the row the user selects
+            uni_table = st.dataframe(
+                df_uni,
+                use_container_width=True,
+                hide_index=True,
+                column_config=UNI_POSITION_COLUMNS,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="uni_positions_table"
+            )
+            
+            selected_rows = uni_table.selection.rows
+            if selected_rows:
+                selected = uni_positions[selected_rows[0]]
+                with st.expander(f"Position details - {df_uni.at[selected_rows[0], 'Pair']}", expanded=True):
+                    st.json(selected)
+            else:
+                st.caption("Select a row to see the full position details")
         else:
             st.info(f"No Uniswap V3 positions found on configured networks: {', '.join(configured_networks)}")
             st.caption("Tip: You can configure which networks to monitor in the Settings tab")
@@ -215,84 +422,79 @@ with main_tabs[0]:
         st.error(f"Error loading Uniswap data: {e}")
         st.info("Make sure you have configured your wallet address in Settings")
     
-    st.markdown("---")
-    st.markdown("---")
-    
-    # DELTA NEUTRAL ANALYSIS
+    st.session_state.uni_positions = uni_positions
+
+
+@st.fragment
+def delta_neutral_section():
+    """Render the Delta Neutral analysis from the positions published by the other sections"""
     st.subheader("🎯 Delta Neutral Analysis")
     
+    positions = st.session_state.get("hl_positions", [])
+    uni_positions = st.session_state.get("uni_positions", [])
+    
+    # Analysis runs on demand (or automatically when the positions change);
+    # the last result is kept in session_state together with the positions
+    # it was computed from, and only shown while they still match
+    run_col, auto_col = st.columns([1, 3])
+    run_analysis = run_col.button("🔄 Run Delta-Neutral Analysis")
+    auto_col.checkbox("Re-run automatically when positions change", key="dn_auto")
+    
     try:
-        # Initialize analyzer
-        analyzer = DeltaNeutralAnalyzer(tolerance_pct=5.0)
-        
-        # Extract LP positions (combine all sources)
-        all_lp_positions = []
-        
-        # Add Uniswap positions if available
-        if 'uni_positions' in locals() and uni_positions:
-            for pos in uni_positions:
-                all_lp_positions.append({
-                    'token0_symbol': pos.token0_symbol,
-                    'token0_amount': pos.token0_amount,
-                    'token1_symbol': pos.token1_symbol,
-                    'token1_amount': pos.token1_amount
-                })
-        
-        # Extract LP token positions
-        lp_token_positions = analyzer.extract_lp_positions(all_lp_positions)
-        
-        # Extract short positions from Hyperliquid
-        hl_positions_dict = []
-        if 'positions' in locals() and positions:
-            for pos in positions:
-                hl_positions_dict.append({
-                    'coin': pos.symbol,
-                    'szi': pos.size
-                })
+        # Hashable snapshots of both sides
+        lp_rows = tuple(
+            (pos.get('token0_symbol', ''), pos.get('token0_amount', 0),
+             pos.get('token1_symbol', ''), pos.get('token1_amount', 0))
+            for pos in uni_positions
+        )
+        short_rows = tuple((pos.symbol, pos.size) for pos in positions)
+        snapshot = (lp_rows, short_rows)
         
-        short_positions = analyzer.extract_short_positions(hl_positions_dict)
+        last_snapshot, suggestions = st.session_state.get("dn_result", (None, None))
+        if last_snapshot != snapshot:
+            suggestions = None
         
-        # Compare and generate suggestions
-        suggestions = analyzer.compare_positions(lp_token_positions, short_positions)
+        if run_analysis or (suggestions is None and st.session_state.get("dn_auto", False)):
+            # Compare and generate suggestions (cached on the position snapshot)
+            suggestions = _analyze_delta_neutral(lp_rows, short_rows, 5.0)
+            st.session_state["dn_result"] = (snapshot, suggestions)
         
-        if suggestions:
+        if suggestions is None:
+            if last_snapshot is not None:
+                st.caption("Positions changed since the last analysis - run it again to update the suggestions")
+            else:
+                st.caption("Click Run Delta-Neutral Analysis to compare LP exposure against Hyperliquid shorts")
+        elif suggestions:
+            # Display detailed suggestions as one table; signed adjustment
+            # (+ increase short, - decrease short) is computed per column
+            df_suggestions = pd.DataFrame([{
+                "Token": suggestion.token,
+                "Action": suggestion.suggested_action,
+                "Current LP": suggestion.current_lp,
+                "Current Short": suggestion.current_short,
+                "Adjustment Needed": suggestion.adjustment_amount
+            } for suggestion in suggestions])
+            df_suggestions.loc[df_suggestions["Action"] == "decrease_short", "Adjustment Needed"] *= -1
+            
             # Display summary
-            balanced_count = sum(1 for s in suggestions if s.suggested_action == "balanced")
-            needs_adjustment_count = len(suggestions) - balanced_count
+            balanced_count = int((df_suggestions["Action"] == "balanced").sum())
+            needs_adjustment_count = len(df_suggestions) - balanced_count
             
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Balanced Positions", balanced_count)
-            with col2:
-                st.metric("Needs Adjustment", needs_adjustment_count)
+            summary = (("Balanced Positions", balanced_count), ("Needs Adjustment", needs_adjustment_count))
+            for col, (label, value) in zip(st.columns(len(summary), gap="small"), summary):
+                col.metric(label, value)
             
             st.markdown("---")
             
-            # Display detailed suggestions
-            for suggestion in suggestions:
-                if suggestion.suggested_action == "balanced":
-                    st.success(f"✅ **{suggestion.token}**: Balanced")
-                    st.caption(f"LP: {suggestion.current_lp:.6f} | Short: {suggestion.current_short:.6f}")
-                elif suggestion.suggested_action == "increase_short":
-                    st.warning(f"⚠️ **{suggestion.token}**: Need to INCREASE SHORT")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Current LP", f"{suggestion.current_lp:.6f}")
-                    with col2:
-                        st.metric("Current Short", f"{suggestion.current_short:.6f}")
-                    with col3:
-                        st.metric("Adjustment Needed", f"+{suggestion.adjustment_amount:.6f}", delta=f"+{suggestion.adjustment_amount:.6f}")
-                elif suggestion.suggested_action == "decrease_short":
-                    st.warning(f"⚠️ **{suggestion.token}**: Need to DECREASE SHORT")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Current LP", f"{suggestion.current_lp:.6f}")
-                    with col2:
-                        st.metric("Current Short", f"{suggestion.current_short:.6f}")
-                    with col3:
-                        st.metric("Adjustment Needed", f"-{suggestion.adjustment_amount:.6f}", delta=f"-{suggestion.adjustment_amount:.6f}")
-                
-                st.markdown("---")
+            df_suggestions["Action"] = df_suggestions["Action"].map(SUGGESTION_LABELS)
+            
+            st.dataframe(
+                df_suggestions.style.format(
+                    {"Current LP": "{:.6f}", "Current Short": "{:.6f}", "Adjustment Needed": "{:+.6f}"}
+                ),
+                use_container_width=True,
+                hide_index=True
+            )
         else:
             st.info("No positions to compare. Configure your wallet and ensure you have both LP positions and Hyperliquid shorts.")
     
@@ -300,106 +502,160 @@ with main_tabs[0]:
         st.error(f"Error in Delta Neutral Analysis: {e}")
         st.info("Make sure you have configured your wallet address and have active positions")
 
-# TAB 2: CONFIGURAÇÕES
-with main_tabs[1]:
-    st.subheader("⚙️ Configurações")
-    
-    # Load current settings
-    current_settings = settings_manager.load_settings()
-    
-    st.write("### Wallet Configuration")
-    
-    wallet_address = st.text_input(
-        "Wallet Public Address",
-        value=current_settings.get("wallet_public_address", config.wallet_public_address),
-        help="Your wallet address to monitor positions",
-        key="cfg_wallet_address"
-    )
-    
-    st.write("### Uniswap V3 Networks")
-    
-    st.write("Select which networks to monitor for LP positions:")
-    
-    available_networks = ["base", "arbitrum", "ethereum", "optimism", "polygon"]
-    current_networks = current_settings.get("uniswap_networks", available_networks)
-    
-    selected_networks = st.multiselect(
-        "Networks",
-        options=available_networks,
-        default=current_networks,
-        help="Select one or more networks to monitor. This is equivalent to what Revert Finance shows.",
-        key="cfg_uniswap_networks"
-    )
-    
-    st.caption("💡 Revert Finance aggregates data from these same Uniswap V3 networks. By selecting multiple networks, you'll see all your positions just like in Revert Finance.")
-    
-    st.write("### The Graph API Key")
-    
-    graph_api_key = st.text_input(
-        "The Graph API Key",
-        value=current_settings.get("graph_api_key", ""),
-        type="password",
-        help="Required for Arbitrum, Optimism, and Polygon networks. Get your free API key at https://thegraph.com/studio/",
-        key="cfg_graph_api_key"
-    )
-    
-    if not graph_api_key and any(net in selected_networks for net in ["arbitrum", "optimism", "polygon"]):
-        st.warning("⚠️ Arbitrum, Optimism, and Polygon require The Graph API key. Positions from these networks won't be shown without it.")
-    
-    if graph_api_key:
-        st.success("✅ The Graph API key configured! All networks will be accessible.")
-    
-    st.caption("🔗 [Get your free API key at The Graph Studio](https://thegraph.com/studio/) (100k queries/month free)")
+
+def render_dashboard():
+    """Render the Dashboard tab: fetch all sources once, then each section"""
+    if st.button("🔄 Refresh", help="Fetch fresh data instead of the cached responses"):
+        clear_data_caches()
+    
+    # Saved settings over config defaults (built once per settings load)
+    settings = st.session_state.effective_settings
+    
+    wallet_addr = settings["wallet_public_address"]
+    hl_key = settings["hyperliquid_api_key"]
+    hl_secret = settings["hyperliquid_api_secret"]
+    
+    # LP source settings (Octav.fi or direct Subgraph queries)
+    use_octav = settings["use_octav"]
+    octav_api_key = settings["octav_api_key"]
+    graph_api_key = settings["graph_api_key"]
+    configured_networks = settings["uniswap_networks"]
+    via_octav = bool(use_octav and octav_api_key)
+    
+    # Gateway networks need a The Graph API key - leave them out of the
+    # subgraph fan-out up front instead of queueing queries that can't run
+    query_networks = configured_networks
+    skipped_networks = []
+    if not via_octav and not graph_api_key:
+        from integrations.uniswap import GATEWAY_SUBGRAPH_IDS
+        query_networks = [n for n in configured_networks if n not in GATEWAY_SUBGRAPH_IDS]
+        skipped_networks = [n for n in configured_networks if n in GATEWAY_SUBGRAPH_IDS]
+    
+    # Fetch all sources concurrently, reporting each one as it completes
+    with st.status("Loading positions...") as status:
+        state_result, lp_result = asyncio.run(_load_dashboard_data(
+            wallet_addr,
+            hl_key,
+            hl_secret,
+            config.hyperliquid_base_url,
+            tuple(query_networks),
+            graph_api_key if graph_api_key else None,
+            octav_api_key if via_octav else None,
+            on_loaded=lambda name: status.write(f"Loaded {name}")
+        ))
+        status.update(label="Positions loaded", state="complete")
+    
+    hyperliquid_section(state_result)
     
     st.markdown("---")
     
-    st.write("### Octav.fi API (Recommended)")
-    
-    use_octav = st.checkbox(
-        "Use Octav.fi API",
-        value=current_settings.get("use_octav", True),
-        help="Octav.fi provides a reliable API to fetch LP positions from all networks. Recommended over direct Subgraph queries.",
-        key="cfg_use_octav"
-    )
-    
-    octav_api_key = st.text_input(
-        "Octav.fi API Key",
-        value=current_settings.get("octav_api_key", ""),
-        type="password",
-        help="Get your API key at https://data.octav.fi/",
-        key="cfg_octav_api_key"
-    )
-    
-    if use_octav and octav_api_key:
-        st.success("✅ Octav.fi API configured! Positions from all networks will be fetched reliably.")
-    elif use_octav and not octav_api_key:
-        st.warning("⚠️ Octav.fi is enabled but API key is missing. Please add your API key.")
-    
-    st.caption("🔗 [Get your free API key at Octav.fi](https://data.octav.fi/)")
+    uniswap_section(lp_result, via_octav, configured_networks, skipped_networks)
     
     st.markdown("---")
     
-    st.write("### Hyperliquid Configuration")
+    delta_neutral_section()
+
+# TAB 2: CONFIGURAÇÕES
+@st.fragment
+def config_fragment():
+    """Render the Configurações tab (reruns on its own, without the Dashboard fetches)"""
+    st.subheader("⚙️ Configurações")
     
-    hl_api_key = st.text_input(
-        "Hyperliquid API Key (optional)",
-        value=current_settings.get("hyperliquid_api_key", config.hyperliquid_api_key or ""),
-        type="password",
-        help="Required for execution",
-        key="cfg_hl_api_key"
-    )
+    if st.session_state.pop("settings_saved", False):
+        st.success("✅ Configuration saved successfully!")
     
-    hl_api_secret = st.text_input(
-        "Hyperliquid API Secret (optional)",
-        value=current_settings.get("hyperliquid_api_secret", config.hyperliquid_api_secret or ""),
-        type="password",
-        help="Required for execution",
-        key="cfg_hl_api_secret"
-    )
+    # Current settings over config defaults (built once per settings load)
+    current_settings = st.session_state.effective_settings
     
-    if st.button("💾 Save Configuration"):
+    # Inputs are buffered in a form so editing only reruns the script on submit
+    with st.form("cfg_form", clear_on_submit=False):
+        st.write("### Wallet Configuration")
+        
+        wallet_address = st.text_input(
+            "Wallet Public Address",
+            value=current_settings["wallet_public_address"],
+            help="Your wallet address to monitor positions",
+            key="cfg_wallet_address"
+        )
+        
+        st.write("### Uniswap V3 Networks")
+        
+        st.write("Select which networks to monitor for LP positions:")
+        
+        available_networks = SETTINGS_DEFAULTS["uniswap_networks"]
+        current_networks = current_settings["uniswap_networks"]
+        
+        selected_networks = st.multiselect(
+            "Networks",
+            options=available_networks,
+            default=current_networks,
+            help="Select one or more networks to monitor. This is equivalent to what Revert Finance shows.",
+            key="cfg_uniswap_networks"
+        )
+        
+        st.caption("💡 Revert Finance aggregates data from these same Uniswap V3 networks. By selecting multiple networks, you'll see all your positions just like in Revert Finance.")
+        st.caption("⚡ Selected networks are queried in parallel (one request each), so load time tracks the slowest network rather than the number of networks.")
+        
+        st.write("### The Graph API Key")
+        
+        graph_api_key = st.text_input(
+            "The Graph API Key",
+            value=current_settings["graph_api_key"],
+            type="password",
+            help="Required for Arbitrum, Optimism, and Polygon networks. Get your free API key at https://thegraph.com/studio/",
+            key="cfg_graph_api_key"
+        )
+
+        
+        st.caption("🔗 [Get your free API key at The Graph Studio](https://thegraph.com/studio/) (100k queries/month free)")
+        
+        st.markdown("---")
+        
+        st.write("### Octav.fi API (Recommended)")
+        
+        use_octav = st.checkbox(
+            "Use Octav.fi API",
+            value=current_settings["use_octav"],
+            help="Octav.fi provides a reliable API to fetch LP positions from all networks. Recommended over direct Subgraph queries.",
+            key="cfg_use_octav"
+        )
+        
+        octav_api_key = st.text_input(
+            "Octav.fi API Key",
+            value=current_settings["octav_api_key"],
+            type="password",
+            help="Get your API key at https://data.octav.fi/",
+            key="cfg_octav_api_key"
+        )
+
+        
+        st.caption("🔗 [Get your free API key at Octav.fi](https://data.octav.fi/)")
+        
+        st.markdown("---")
+        
+        st.write("### Hyperliquid Configuration")
+        
+        hl_api_key = st.text_input(
+            "Hyperliquid API Key (optional)",
+            value=current_settings["hyperliquid_api_key"],
+            type="password",
+            help="Required for execution",
+            key="cfg_hl_api_key"
+        )
+        
+        hl_api_secret = st.text_input(
+            "Hyperliquid API Secret (optional)",
+            value=current_settings["hyperliquid_api_secret"],
+            type="password",
+            help="Required for execution",
+            key="cfg_hl_api_secret"
+        )
+        
+        submitted = st.form_submit_button("💾 Save Configuration")
+    
+    if submitted:
         # Update settings
-        new_settings = current_settings.copy()
+        new_settings = st.session_state.settings.copy()
         new_settings["wallet_public_address"] = wallet_address
         new_settings["uniswap_networks"] = selected_networks
         new_settings["graph_api_key"] = graph_api_key
@@ -410,17 +666,35 @@ with main_tabs[1]:
         
         # Save to file
         if settings_manager.save_settings(new_settings):
-            st.success("✅ Configuration saved successfully!")
-            st.info("🔄 Please refresh the page to apply changes.")
+            set_settings(new_settings)
+            # Drop data fetched with the old settings (clients stay warm) and
+            # rerun the whole app so every section picks up the new values
+            clear_data_caches()
+            st.session_state.settings_saved = True
+            st.rerun()
         else:
             st.error("❌ Failed to save configuration. Please try again.")
     
+    # Form values only reach the script on submit, so key status is reported
+    # for the saved configuration, below the form
+    saved_graph_key = current_settings["graph_api_key"]
+    saved_networks = current_settings["uniswap_networks"]
+    if not saved_graph_key and any(net in saved_networks for net in ["arbitrum", "optimism", "polygon"]):
+        st.warning("⚠️ Saved configuration: Arbitrum, Optimism, and Polygon require The Graph API key. Positions from these networks won't be shown without it.")
+    elif saved_graph_key:
+        st.success("✅ Saved configuration: The Graph API key present. All networks will be accessible.")
+    
+    if current_settings["use_octav"] and current_settings["octav_api_key"]:
+        st.success("✅ Saved configuration: Octav.fi API enabled with a key. Positions from all networks will be fetched reliably.")
+    elif current_settings["use_octav"]:
+        st.warning("⚠️ Saved configuration: Octav.fi is enabled but the API key is missing. Please add your API key.")
+    
     st.markdown("---")
     
     st.write("### System Information")
     
     # Show current saved settings
-    display_settings = settings_manager.load_settings()
+    display_settings = st.session_state.settings
     
     st.write(f"**Operation Mode:** {config.operation_mode}")
     st.write(f"**Wallet Address:** {display_settings.get('wallet_public_address', 'Not configured')}")
@@ -434,5 +708,15 @@ with main_tabs[1]:
     
     st.write(f"**Settings File:** data/user_settings.json")
 
+
+if active_tab == "📊 Dashboard":
+    render_dashboard()
+else:
+    config_fragment()
+
 st.markdown("---")
-st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+# Show when the data was fetched from the API, not when the script reran
+fetched_at = st.session_state.get("data_fetched_at")
+if fetched_at:
+    st.caption(f"Last updated: {fetched_at}")
@@ -15,6 +15,12 @@ class ConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         self.config_file = self.config_dir / "config.json"
+        
+        # Raw file text keyed by (mtime_ns, size); every method reloads the config,
+        # so reruns only stat the file instead of reopening it while it is unchanged
+        self._cached_stat = None
+        self._cached_text = None
+        
         self._migrate_to_multi_wallet()
     
     def _migrate_to_multi_wallet(self):
@@ -90,8 +96,13 @@ class ConfigManager:
             }
         
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            stat = self.config_file.stat()
+            file_stat = (stat.st_mtime_ns, stat.st_size)
+            if file_stat != self._cached_stat:
+                self._cached_text = self.config_file.read_text()
+                self._cached_stat = file_stat
+            # Parsed per call so callers can mutate the returned dict freely
+            return json.loads(self._cached_text)
         except Exception as e:
             print(f"Error loading config: {e}")
             return {
@@ -104,8 +115,14 @@ class ConfigManager:
         """Save full multi-wallet configuration"""
         config["saved_at"] = datetime.now().isoformat()
         
+        text = json.dumps(config, indent=2)
         with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+            f.write(text)
+        
+        # Write-through: the next load doesn't need to re-read the file
+        stat = self.config_file.stat()
+        self._cached_text = text
+        self._cached_stat = (stat.st_mtime_ns, stat.st_size)
         
         return True
     
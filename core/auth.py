@@ -4,7 +4,7 @@ Handles user authentication with bcrypt password hashing.
 """
 import bcrypt
 import streamlit as st
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from datetime import datetime, timedelta
 
 
@@ -124,6 +124,22 @@ class AuthManager:
         return hashed.decode('utf-8')
 
 
+@st.cache_resource
+def get_auth_manager(users: Tuple[Tuple[str, str], ...]) -> AuthManager:
+    """
+    Get a shared authentication manager.
+    
+    Built once per process instead of on every script rerun.
+    
+    Args:
+        users: Sorted tuple of (username, hashed_password) pairs
+        
+    Returns:
+        AuthManager instance
+    """
+    return AuthManager(dict(users))
+
+
 def render_login_page(auth_manager: AuthManager):
     """
     Render login page.
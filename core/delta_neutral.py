@@ -5,6 +5,8 @@ Compares LP positions with Hyperliquid shorts and suggests adjustments
 
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
+import numpy as np
+import pandas as pd
 
 
 @dataclass
@@ -26,6 +28,45 @@ class DeltaNeutralSuggestion:
     adjustment_amount: float
 
 
+def classify_positions(
+    lp: np.ndarray,
+    short: np.ndarray,
+    tolerance_pct: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Classify aligned LP/short amounts into hedge actions
+    
+    Args:
+        lp: LP amount per token
+        short: Short amount per token (same order as lp)
+        tolerance_pct: Tolerance percentage for considering positions balanced
+        
+    Returns:
+        Tuple (difference, actions, adjustments) with one entry per token
+    """
+    # Calculate difference
+    difference = lp - short
+    
+    # Calculate percentage difference (100% when only a short exists)
+    pct_diff = np.divide(
+        np.abs(difference) * 100,
+        lp,
+        out=np.where(short > 0, 100.0, 0.0),
+        where=lp > 0
+    )
+    
+    # Determine action
+    balanced = pct_diff <= tolerance_pct
+    actions = np.select(
+        [balanced, difference > 0],
+        ["balanced", "increase_short"],
+        default="decrease_short"
+    )
+    adjustments = np.where(balanced, 0.0, np.abs(difference))
+    
+    return difference, actions, adjustments
+
+
 class DeltaNeutralAnalyzer:
     """Analyzes LP and short positions to maintain delta neutral"""
     
@@ -143,70 +184,50 @@ class DeltaNeutralAnalyzer:
         Returns:
             List of suggestions
         """
-        suggestions = []
-        
-        # Normalize all symbols
-        normalized_lp = {}
-        for symbol, position in lp_positions.items():
-            norm_symbol = self.normalize_token_symbols(symbol)
-            if norm_symbol in normalized_lp:
-                normalized_lp[norm_symbol].amount += position.amount
-            else:
-                normalized_lp[norm_symbol] = TokenPosition(
-                    symbol=norm_symbol,
-                    amount=position.amount,
-                    value_usd=position.value_usd
-                )
-        
-        normalized_shorts = {}
-        for symbol, amount in short_positions.items():
-            norm_symbol = self.normalize_token_symbols(symbol)
-            if norm_symbol in normalized_shorts:
-                normalized_shorts[norm_symbol] += amount
-            else:
-                normalized_shorts[norm_symbol] = amount
-        
-        # Get all unique tokens
-        all_tokens = set(normalized_lp.keys()) | set(normalized_shorts.keys())
-        
-        for token in all_tokens:
-            lp_amount = normalized_lp.get(token, TokenPosition(token, 0, 0)).amount
-            short_amount = normalized_shorts.get(token, 0)
-            
-            # Calculate difference
-            difference = lp_amount - short_amount
-            
-            # Calculate percentage difference
-            if lp_amount > 0:
-                pct_diff = abs(difference / lp_amount) * 100
-            else:
-                pct_diff = 100 if short_amount > 0 else 0
-            
-            # Determine action
-            if pct_diff <= self.tolerance_pct:
-                action = "balanced"
-                adjustment = 0
-            elif difference > 0:
-                # Need more shorts
-                action = "increase_short"
-                adjustment = difference
-            else:
-                # Need less shorts
-                action = "decrease_short"
-                adjustment = abs(difference)
-            
-            suggestion = DeltaNeutralSuggestion(
+        # Aggregate both sides by normalized symbol and align them on the
+        # union of tokens (missing side = 0)
+        lp_amounts = self._sum_by_symbol(
+            {symbol: position.amount for symbol, position in lp_positions.items()}
+        )
+        short_amounts = self._sum_by_symbol(short_positions)
+        lp_amounts, short_amounts = lp_amounts.align(short_amounts, fill_value=0.0)
+        
+        if lp_amounts.empty:
+            return []
+        
+        difference, actions, adjustments = classify_positions(
+            lp_amounts.to_numpy(), short_amounts.to_numpy(), self.tolerance_pct
+        )
+        
+        return [
+            DeltaNeutralSuggestion(
                 token=token,
-                current_lp=lp_amount,
-                current_short=short_amount,
-                difference=difference,
-                suggested_action=action,
-                adjustment_amount=adjustment
+                current_lp=float(lp_amount),
+                current_short=float(short_amount),
+                difference=float(diff),
+                suggested_action=str(action),
+                adjustment_amount=float(adjustment)
             )
+            for token, lp_amount, short_amount, diff, action, adjustment in zip(
+                lp_amounts.index, lp_amounts, short_amounts, difference, actions, adjustments
+            )
+        ]
+    
+    def _sum_by_symbol(self, amounts: Dict[str, float]) -> pd.Series:
+        """
+        Sum amounts by normalized token symbol
+        
+        Args:
+            amounts: Dictionary mapping token symbol to amount
             
-            suggestions.append(suggestion)
+        Returns:
+            Series of amounts indexed by normalized symbol
+        """
+        if not amounts:
+            return pd.Series(dtype=float)
         
-        return suggestions
+        series = pd.Series(amounts, dtype=float)
+        return series.groupby(series.index.map(self.normalize_token_symbols)).sum()
     
     def format_suggestions(self, suggestions: List[DeltaNeutralSuggestion]) -> str:
         """
@@ -5,6 +5,7 @@ Permite salvar e carregar configurações do usuário em arquivo JSON
 
 import json
 import os
+import tempfile
 from typing import Dict, Any, Optional
 from pathlib import Path
 import streamlit as st
@@ -23,6 +24,10 @@ class SettingsManager:
         self.settings_file = settings_file
         self._ensure_data_dir()
         
+        # Cache em memória do arquivo, válido enquanto o mtime não mudar
+        self._cache: Optional[Dict[str, Any]] = None
+        self._mtime: float = 0.0
+        
     def _ensure_data_dir(self):
         """Garante que o diretório de dados existe"""
         data_dir = os.path.dirname(self.settings_file)
@@ -36,13 +41,21 @@ class SettingsManager:
         Returns:
             Dict com configurações ou dict vazio se arquivo não existir
         """
-        if not os.path.exists(self.settings_file):
+        try:
+            mtime = os.stat(self.settings_file).st_mtime
+        except FileNotFoundError:
             return self._get_default_settings()
         
+        # Arquivo não mudou desde a última leitura: evita abrir e parsear o JSON
+        if self._cache is not None and mtime == self._mtime:
+            return dict(self._cache)
+        
         try:
             with open(self.settings_file, 'r') as f:
                 settings = json.load(f)
-            return settings
+            self._cache = settings
+            self._mtime = mtime
+            return dict(settings)
         except Exception as e:
             st.error(f"Erro ao carregar configurações: {e}")
             return self._get_default_settings()
@@ -58,8 +71,20 @@ class SettingsManager:
             True se salvou com sucesso, False caso contrário
         """
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Escrita atômica: grava em arquivo temporário e substitui
+            data_dir = os.path.dirname(self.settings_file) or "."
+            fd, tmp_path = tempfile.mkstemp(dir=data_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(settings, f, indent=2)
+                os.replace(tmp_path, self.settings_file)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            
+            # Write-through: atualiza o cache sem reler o arquivo
+            self._cache = dict(settings)
+            self._mtime = os.stat(self.settings_file).st_mtime
             return True
         except Exception as e:
             st.error(f"Erro ao salvar configurações: {e}")
@@ -264,14 +289,18 @@ class SettingsManager:
         """
         return self.get_setting("auto_execute_enabled", False)
     
-    def has_credentials(self) -> Dict[str, bool]:
+    def has_credentials(self, settings: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
         """
         Verifica quais credenciais estão configuradas
         
+        Args:
+            settings: Configurações já carregadas (evita reler o arquivo)
+            
         Returns:
             Dict com status de cada credencial
         """
-        settings = self.load_settings()
+        if settings is None:
+            settings = self.load_settings()
         
         return {
             "wallet_public": bool(settings.get("wallet_public_address")),
@@ -283,14 +312,17 @@ class SettingsManager:
             "aerodrome_pool": bool(settings.get("aerodrome_pool_address")),
         }
     
-    def get_operation_mode(self) -> str:
+    def get_operation_mode(self, settings: Optional[Dict[str, Any]] = None) -> str:
         """
         Determina o modo de operação baseado nas credenciais
         
+        Args:
+            settings: Configurações já carregadas (evita reler o arquivo)
+            
         Returns:
             "READ_ONLY", "PARTIAL", ou "FULL"
         """
-        creds = self.has_credentials()
+        creds = self.has_credentials(settings)
         
         if not creds["wallet_public"]:
             return "READ_ONLY"
@@ -3,6 +3,7 @@ Delta Neutral Analyzer
 Compares LP positions with short positions and suggests adjustments
 """
 
+from collections import defaultdict
 from typing import Dict, List
 from dataclasses import dataclass
 
@@ -160,6 +161,22 @@ class DeltaNeutralAnalyzer:
         
         return suggestions
     
+    @staticmethod
+    def group_by_status(suggestions: List[DeltaNeutralSuggestion]) -> Dict[str, List[DeltaNeutralSuggestion]]:
+        """
+        Bucket suggestions by status in a single pass
+        
+        Args:
+            suggestions: List of suggestions
+            
+        Returns:
+            Dictionary of status -> suggestions (missing statuses map to an empty list)
+        """
+        buckets = defaultdict(list)
+        for s in suggestions:
+            buckets[s.status].append(s)
+        return buckets
+    
     def format_suggestions(self, suggestions: List[DeltaNeutralSuggestion]) -> str:
         """
         Format suggestions as human-readable text
@@ -180,9 +197,10 @@ class DeltaNeutralAnalyzer:
         lines.append("")
         
         # Separate by status
-        balanced = [s for s in suggestions if s.status == "balanced"]
-        under_hedged = [s for s in suggestions if s.status == "under_hedged"]
-        over_hedged = [s for s in suggestions if s.status == "over_hedged"]
+        buckets = self.group_by_status(suggestions)
+        balanced = buckets["balanced"]
+        under_hedged = buckets["under_hedged"]
+        over_hedged = buckets["over_hedged"]
         
         # Summary
         lines.append(f"📊 RESUMO:")
@@ -10,7 +10,7 @@ from typing import Optional, Dict, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Perpetual position data."""
     symbol: str
@@ -43,7 +43,8 @@ class HyperliquidClient:
         base_url: str,
         wallet_address: str,
         api_key: Optional[str] = None,
-        api_secret: Optional[str] = None
+        api_secret: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize Hyperliquid client.
@@ -53,6 +54,7 @@ class HyperliquidClient:
             wallet_address: User wallet address
             api_key: Optional API key for execution mode
             api_secret: Optional API secret for execution mode
+            session: Optional shared HTTP session (a new one is created if omitted)
         """
         self.base_url = base_url
         self.wallet_address = wallet_address
@@ -61,6 +63,10 @@ class HyperliquidClient:
         
         # Check if in execution mode
         self.is_execution_mode = bool(api_key and api_secret)
+        
+        # Persistent HTTP session - keeps the connection to the info
+        # endpoint alive across calls instead of a new TLS handshake each time
+        self.session = session or requests.Session()
     
     def _sign_request(self, method: str, endpoint: str, params: Dict) -> Dict[str, str]:
         """
@@ -101,7 +107,7 @@ class HyperliquidClient:
             True if API is responding, False otherwise
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/info",
                 timeout=5
             )
@@ -109,16 +115,18 @@ class HyperliquidClient:
         except Exception:
             return False
     
-    def get_positions(self) -> List[Position]:
+    def get_state(self) -> Dict:
         """
-        Get open positions for wallet (read-only).
+        Get the raw clearinghouse state for wallet (read-only).
+        
+        A single request returns both the margin summary and the open
+        positions; use parse_balance / parse_positions to split it.
         
         Returns:
-            List of Position objects
+            Clearinghouse state JSON, or empty dict on error
         """
         try:
-            # Query Hyperliquid clearinghouse state
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/info",
                 json={
                     "type": "clearinghouseState",
@@ -129,13 +137,30 @@ class HyperliquidClient:
             
             if response.status_code != 200:
                 print(f"[ERROR] Hyperliquid API returned status {response.status_code}")
-                return []
+                return {}
+            
+            return response.json()
+            
+        except Exception as e:
+            print(f"Error getting clearinghouse state: {e}")
+            return {}
+    
+    @staticmethod
+    def parse_positions(state: Dict) -> List[Position]:
+        """
+        Extract open positions from a clearinghouse state.
+        
+        Args:
+            state: Clearinghouse state as returned by get_state()
             
-            data = response.json()
+        Returns:
+            List of Position objects
+        """
+        try:
             positions = []
             
             # Parse asset positions
-            for asset_pos in data.get("assetPositions", []):
+            for asset_pos in state.get("assetPositions", []):
                 pos_data = asset_pos.get("position", {})
                 
                 # Extract position data
@@ -174,6 +199,55 @@ class HyperliquidClient:
             print(f"Error getting positions: {e}")
             return []
     
+    @staticmethod
+    def parse_balance(state: Dict) -> Dict[str, float]:
+        """
+        Extract account balance from a clearinghouse state.
+        
+        Args:
+            state: Clearinghouse state as returned by get_state()
+            
+        Returns:
+            Dictionary with balance info, or empty dict if state is empty
+        """
+        if not state:
+            return {}
+        
+        try:
+            # Extract margin summary
+            margin_summary = state.get("marginSummary", {})
+            
+            account_value = float(margin_summary.get("accountValue", 0))
+            total_margin_used = float(margin_summary.get("totalMarginUsed", 0))
+            total_raw_usd = float(margin_summary.get("totalRawUsd", 0))
+            withdrawable = float(state.get("withdrawable", 0))
+            
+            # Calculate unrealized PnL from positions
+            unrealized_pnl = 0.0
+            for asset_pos in state.get("assetPositions", []):
+                pos_data = asset_pos.get("position", {})
+                unrealized_pnl += float(pos_data.get("unrealizedPnl", 0))
+            
+            return {
+                "total_equity": account_value,
+                "available_balance": withdrawable,
+                "margin_used": total_margin_used,
+                "unrealized_pnl": unrealized_pnl,
+                "total_raw_usd": total_raw_usd
+            }
+        except Exception as e:
+            print(f"Error getting balance: {e}")
+            return {}
+    
+    def get_positions(self) -> List[Position]:
+        """
+        Get open positions for wallet (read-only).
+        
+        Returns:
+            List of Position objects
+        """
+        return self.parse_positions(self.get_state())
+    
     def get_funding_info(self, symbol: str) -> Optional[FundingInfo]:
         """
         Get funding rate information (read-only).
@@ -205,7 +279,7 @@ class HyperliquidClient:
         """
         try:
             # Query all mids from Hyperliquid
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/info",
                 json={"type": "allMids"},
                 timeout=10
@@ -236,47 +310,7 @@ class HyperliquidClient:
         Returns:
             Dictionary with balance info
         """
-        try:
-            # Query Hyperliquid clearinghouse state
-            response = requests.post(
-                f"{self.base_url}/info",
-                json={
-                    "type": "clearinghouseState",
-                    "user": self.wallet_address
-                },
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                print(f"[ERROR] Hyperliquid API returned status {response.status_code}")
-                return {}
-            
-            data = response.json()
-            
-            # Extract margin summary
-            margin_summary = data.get("marginSummary", {})
-            
-            account_value = float(margin_summary.get("accountValue", 0))
-            total_margin_used = float(margin_summary.get("totalMarginUsed", 0))
-            total_raw_usd = float(margin_summary.get("totalRawUsd", 0))
-            withdrawable = float(data.get("withdrawable", 0))
-            
-            # Calculate unrealized PnL from positions
-            unrealized_pnl = 0.0
-            for asset_pos in data.get("assetPositions", []):
-                pos_data = asset_pos.get("position", {})
-                unrealized_pnl += float(pos_data.get("unrealizedPnl", 0))
-            
-            return {
-                "total_equity": account_value,
-                "available_balance": withdrawable,
-                "margin_used": total_margin_used,
-                "unrealized_pnl": unrealized_pnl,
-                "total_raw_usd": total_raw_usd
-            }
-        except Exception as e:
-            print(f"Error getting balance: {e}")
-            return {}
+        return self.parse_balance(self.get_state())
     
     # Execution functions (require API keys)
     
@@ -4,21 +4,29 @@ Fetches LP positions from multiple networks using Octav.fi API
 """
 
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 
+# orjson is optional - faster parsing of the larger portfolio responses
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
 class OctavClient:
     """Client for Octav.fi API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize Octav client
         
         Args:
             api_key: Octav.fi API key (JWT token)
+            session: Optional shared HTTP session (a new one is created if omitted)
         """
         self.api_key = api_key
         self.base_url = "https://data.octav.fi/api"
@@ -26,6 +34,13 @@ class OctavClient:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        
+        # Persistent HTTP session - reuses the TLS connection across calls
+        self.session = session or requests.Session()
+        
+        # Last positions response per address as (ETag, parsed positions),
+        # so unchanged portfolios come back as a bodyless 304
+        self._positions_cache: Dict[str, Tuple[str, List[Dict]]] = {}
     
     def get_positions(self, wallet_address: str) -> List[Dict]:
         """
@@ -42,18 +57,33 @@ class OctavClient:
             # Note: This is a placeholder - need to check actual API docs
             url = f"{self.base_url}/positions"
             
+            address = wallet_address.lower()
             params = {
-                "address": wallet_address.lower()
+                "address": address
             }
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            headers = self.headers
+            cached = self._positions_cache.get(address)
+            if cached:
+                headers = {**self.headers, "If-None-Match": cached[0]}
+            
+            response = self.session.get(url, headers=headers, params=params, timeout=30)
+            
+            # Not modified since the last call - reuse the positions parsed then
+            if response.status_code == 304 and cached:
+                return cached[1]
+            
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content) if HAS_ORJSON else response.json()
             
             # Parse and standardize the response
             positions = self._parse_positions(data)
             
+            etag = response.headers.get("ETag")
+            if etag:
+                self._positions_cache[address] = (etag, positions)
+            
             logger.info(f"Found {len(positions)} positions via Octav.fi for {wallet_address}")
             return positions
             
@@ -122,10 +152,10 @@ class OctavClient:
                 "address": wallet_address.lower()
             }
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content) if HAS_ORJSON else response.json()
             
             summary = {
                 "total_value_usd": data.get("net_worth", 0),
@@ -5,9 +5,17 @@ Usa The Graph Gateway para redes que requerem API key
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+# orjson é opcional: parse mais rápido das respostas grandes dos subgraphs
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Subgraph IDs para The Graph Gateway (redes que requerem API key)
 GATEWAY_SUBGRAPH_IDS = {
@@ -24,8 +32,44 @@ PUBLIC_SUBGRAPHS = {
     "bsc": "https://api.thegraph.com/subgraphs/name/ianlapham/uniswap-v3-bsc"
 }
 
+# Todas as posições ativas da wallet em uma única consulta por rede
+# (apenas os campos usados no parse)
+POSITIONS_QUERY = """
+query ($owner: String!) {
+  positions(where: {owner: $owner, liquidity_gt: "0"}) {
+    id
+    liquidity
+    depositedToken0
+    depositedToken1
+    withdrawnToken0
+    withdrawnToken1
+    collectedFeesToken0
+    collectedFeesToken1
+    pool {
+      id
+      token0 {
+        symbol
+        decimals
+      }
+      token1 {
+        symbol
+        decimals
+      }
+      feeTier
+      tick
+    }
+    tickLower {
+      tickIdx
+    }
+    tickUpper {
+      tickIdx
+    }
+  }
+}
+"""
 
-@dataclass
+
+@dataclass(slots=True)
 class UniswapPosition:
     """Representa uma posição LP no Uniswap V3"""
     id: str
@@ -40,12 +84,17 @@ class UniswapPosition:
     fee_tier: float
     in_range: bool
     network: str  # Rede onde a posição está
+    # O subgraph não retorna valores em USD; padrão 0.0 mantém o mesmo
+    # esquema das posições do Octav.fi
+    value_usd: float = 0.0
+    uncollected_fees_usd: float = 0.0
 
 
 class UniswapClient:
     """Cliente para interagir com Uniswap V3 via Subgraph em múltiplas redes"""
     
-    def __init__(self, wallet_address: str, networks: List[str] = None, graph_api_key: str = None):
+    def __init__(self, wallet_address: str, networks: List[str] = None, graph_api_key: str = None,
+                 session: Optional[requests.Session] = None):
         """
         Inicializa o cliente Uniswap
         
@@ -53,13 +102,20 @@ class UniswapClient:
             wallet_address: Endereço da wallet para buscar posições
             networks: Lista de redes para buscar (default: todas disponíveis)
             graph_api_key: API key do The Graph Gateway (necessária para Arbitrum, Optimism, Polygon)
+            session: Sessão HTTP compartilhada opcional (cria uma nova se omitida)
         """
         self.wallet_address = wallet_address.lower()
         self.graph_api_key = graph_api_key
         
         # Todas as redes disponíveis
         all_networks = list(PUBLIC_SUBGRAPHS.keys()) + list(GATEWAY_SUBGRAPH_IDS.keys())
-        self.networks = networks or all_networks
+        self.networks = networks if networks is not None else all_networks
+        
+        # Sessão HTTP persistente - as redes do Gateway compartilham o mesmo host,
+        # então a conexão TLS é reaproveitada entre as consultas
+        if session is None:
+            session = requests.Session()
+        self.session = session
     
     def get_positions(self) -> List[UniswapPosition]:
         """
@@ -68,17 +124,32 @@ class UniswapClient:
         Returns:
             Lista de posições Uniswap de todas as redes
         """
-        all_positions = []
+        if not self.networks:
+            return []
         
-        for network in self.networks:
-            try:
-                network_positions = self._get_positions_from_network(network)
-                all_positions.extend(network_positions)
-            except Exception as e:
-                print(f"Erro ao buscar posições de {network}: {e}")
-                continue
+        # As consultas por rede são independentes e limitadas por I/O, então
+        # rodam em paralelo - o tempo total passa a ser o da rede mais lenta.
+        # O pool vive só durante a busca, então nenhuma thread sobra quando o
+        # cliente é descartado
+        with ThreadPoolExecutor(max_workers=len(self.networks), thread_name_prefix="uniswap") as executor:
+            results = list(executor.map(self._get_positions_safe, self.networks))
+        return [position for network_positions in results for position in network_positions]
+    
+    def _get_positions_safe(self, network: str) -> List[UniswapPosition]:
+        """
+        Busca posições de uma rede, retornando lista vazia em caso de erro
         
-        return all_positions
+        Args:
+            network: Nome da rede
+            
+        Returns:
+            Lista de posições da rede
+        """
+        try:
+            return self._get_positions_from_network(network)
+        except Exception as e:
+            print(f"Erro ao buscar posições de {network}: {e}")
+            return []
     
     def _get_subgraph_url(self, network: str) -> Optional[str]:
         """
@@ -120,48 +191,11 @@ class UniswapClient:
         if not subgraph_url:
             return []
         
-        query = """
-        query ($owner: String!) {
-          positions(where: {owner: $owner, liquidity_gt: "0"}) {
-            id
-            liquidity
-            depositedToken0
-            depositedToken1
-            withdrawnToken0
-            withdrawnToken1
-            collectedFeesToken0
-            collectedFeesToken1
-            pool {
-              id
-              token0 {
-                id
-                symbol
-                decimals
-              }
-              token1 {
-                id
-                symbol
-                decimals
-              }
-              feeTier
-              sqrtPrice
-              tick
-            }
-            tickLower {
-              tickIdx
-            }
-            tickUpper {
-              tickIdx
-            }
-          }
-        }
-        """
-        
         try:
-            response = requests.post(
+            response = self.session.post(
                 subgraph_url,
                 json={
-                    "query": query,
+                    "query": POSITIONS_QUERY,
                     "variables": {"owner": self.wallet_address}
                 },
                 timeout=15
@@ -171,7 +205,7 @@ class UniswapClient:
                 print(f"Erro HTTP {response.status_code} ao consultar {network}")
                 return []
             
-            data = response.json()
+            data = orjson.loads(response.content) if HAS_ORJSON else response.json()
             
             if "errors" in data:
                 print(f"Erros GraphQL de {network}: {data['errors']}")
@@ -186,18 +220,22 @@ class UniswapClient:
                     token0 = pool["token0"]
                     token1 = pool["token1"]
                     
+                    # Escala de decimais calculada uma vez por token
+                    scale0 = 10 ** int(token0["decimals"])
+                    scale1 = 10 ** int(token1["decimals"])
+                    
                     # Calcular amounts (valores depositados menos retirados)
                     token0_amount = (
                         float(pos["depositedToken0"]) - float(pos["withdrawnToken0"])
-                    ) / (10 ** int(token0["decimals"]))
+                    ) / scale0
                     
                     token1_amount = (
                         float(pos["depositedToken1"]) - float(pos["withdrawnToken1"])
-                    ) / (10 ** int(token1["decimals"]))
+                    ) / scale1
                     
                     # Fees coletadas
-                    fees_token0 = float(pos["collectedFeesToken0"]) / (10 ** int(token0["decimals"]))
-                    fees_token1 = float(pos["collectedFeesToken1"]) / (10 ** int(token1["decimals"]))
+                    fees_token0 = float(pos["collectedFeesToken0"]) / scale0
+                    fees_token1 = float(pos["collectedFeesToken1"]) / scale1
                     
                     # Verificar se está in range
                     current_tick = int(pool["tick"])
@@ -4,7 +4,10 @@ UNIVERSAL PROTOCOL SUPPORT - Extracts LP positions from ALL protocols
 """
 
 import requests
-from typing import Dict, List
+from collections import defaultdict
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
@@ -37,12 +40,13 @@ class PerpPosition:
 class OctavClient:
     """Client for Octav.fi API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize Octav client
         
         Args:
             api_key: Octav.fi API key (Bearer token)
+            session: Optional HTTP session (a pooled one is created if omitted)
         """
         self.api_key = api_key
         self.base_url = "https://api.octav.fi/v1"
@@ -50,6 +54,13 @@ class OctavClient:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        
+        # Persistent HTTP session - keeps the TLS connection to Octav.fi alive
+        # between portfolio fetches
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+        self.session = session
     
     def get_portfolio(self, wallet_address: str) -> Dict:
         """
@@ -69,7 +80,7 @@ class OctavClient:
                 "waitForSync": "false"
             }
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -271,9 +282,60 @@ class OctavClient:
         return perp_positions
     
     @staticmethod
+    def aggregate_lp_balances(lp_positions: List[LPPosition]) -> Dict[str, float]:
+        """
+        Sum LP balances per normalized token symbol
+        
+        Args:
+            lp_positions: LP positions from extract_lp_positions
+            
+        Returns:
+            Dictionary of token -> total LP balance
+        """
+        lp_balances = defaultdict(float)
+        for pos in lp_positions:
+            lp_balances[OctavClient.normalize_symbol(pos.token_symbol)] += pos.balance
+        return dict(lp_balances)
+    
+    @staticmethod
+    def aggregate_short_balances(perp_positions: List[PerpPosition]) -> Dict[str, float]:
+        """
+        Sum short sizes (as positive amounts) per normalized token symbol
+        
+        Args:
+            perp_positions: Perp positions from extract_perp_positions
+            
+        Returns:
+            Dictionary of token -> total short size
+        """
+        short_balances = defaultdict(float)
+        for pos in perp_positions:
+            if pos.size < 0:
+                short_balances[OctavClient.normalize_symbol(pos.symbol)] += abs(pos.size)
+        return dict(short_balances)
+    
+    @staticmethod
+    def extract_token_prices(lp_positions: List[LPPosition]) -> Dict[str, float]:
+        """
+        Get token prices from LP positions, keyed like the aggregated balances
+        
+        Args:
+            lp_positions: LP positions from extract_lp_positions
+            
+        Returns:
+            Dictionary of token -> USD price
+        """
+        return {
+            OctavClient.normalize_symbol(pos.token_symbol): pos.price
+            for pos in lp_positions
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
     def normalize_symbol(symbol: str) -> str:
         """
-        Normalize token symbol for comparison
+        Normalize token symbol for comparison (memoized - portfolios repeat
+        the same few symbols across many positions)
         
         Args:
             symbol: Token symbol (e.g., 'WBTC', 'weth', 'BTC')
@@ -62,8 +62,8 @@ def render_credentials_section(settings: Dict[str, Any], manager: SettingsManage
     st.info("💡 **Modo Somente Leitura:** Configure apenas a wallet pública para análise sem execução")
     
     # Status de credenciais
-    creds = manager.has_credentials()
-    operation_mode = manager.get_operation_mode()
+    creds = manager.has_credentials(settings)
+    operation_mode = manager.get_operation_mode(settings)
     
     mode_colors = {
         "READ_ONLY": "🔵",
@@ -83,102 +83,107 @@ def render_credentials_section(settings: Dict[str, Any], manager: SettingsManage
     
     st.markdown("---")
     
-    # Wallet & Blockchain
-    st.markdown("### 🔗 Wallet & Blockchain")
+    # Fora do form para que o aviso de execução acompanhe o que foi digitado
+    # (ou apagado); o valor é salvo junto com o form
+    wallet_private = st.text_input(
+        "Chave Privada da Wallet",
+        value=settings.get("wallet_private_key", ""),
+        help="⚠️ Necessária apenas para execução. Deixe vazio para modo somente leitura",
+        type="password"
+    )
     
-    col1, col2 = st.columns(2)
+    if wallet_private:
+        st.warning("⚠️ Chave privada configurada. Execução habilitada!")
     
-    with col1:
-        wallet_public = st.text_input(
-            "Endereço Público da Wallet",
-            value=settings.get("wallet_public_address", ""),
-            help="Endereço público da sua wallet (0x...)",
-            type="default"
-        )
+    # Campos agrupados em um form: editar não dispara rerun até salvar
+    with st.form("settings_credentials"):
+        # Wallet & Blockchain
+        st.markdown("### 🔗 Wallet & Blockchain")
         
-        base_rpc = st.text_input(
-            "Base RPC URL",
-            value=settings.get("base_rpc_url", "https://mainnet.base.org"),
-            help="URL do RPC da rede Base"
-        )
-    
-    with col2:
-        wallet_private = st.text_input(
-            "Chave Privada da Wallet",
-            value=settings.get("wallet_private_key", ""),
-            help="⚠️ Necessária apenas para execução. Deixe vazio para modo somente leitura",
-            type="password"
-        )
+        col1, col2 = st.columns(2)
         
-        if wallet_private:
-            st.warning("⚠️ Chave privada configurada. Execução habilitada!")
-    
-    st.markdown("---")
-    
-    # Aerodrome
-    st.markdown("### 🌊 Aerodrome (Base L2)")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        aerodrome_subgraph = st.text_input(
-            "Subgraph URL",
-            value=settings.get("aerodrome_subgraph_url", ""),
-            help="URL do subgraph da Aerodrome"
-        )
+        with col1:
+            wallet_public = st.text_input(
+                "Endereço Público da Wallet",
+                value=settings.get("wallet_public_address", ""),
+                help="Endereço público da sua wallet (0x...)",
+                type="default"
+            )
         
-        aerodrome_pool = st.text_input(
-            "Pool Address",
-            value=settings.get("aerodrome_pool_address", ""),
-            help="Endereço do pool ETH/BTC na Aerodrome"
-        )
-    
-    with col2:
-        aerodrome_router = st.text_input(
-            "Router Address",
-            value=settings.get("aerodrome_router", ""),
-            help="Endereço do router da Aerodrome"
-        )
-    
-    st.markdown("---")
-    
-    # Hyperliquid
-    st.markdown("### ⚡ Hyperliquid")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        hyperliquid_base_url = st.text_input(
-            "Base URL",
-            value=settings.get("hyperliquid_base_url", "https://api.hyperliquid.xyz"),
-            help="URL base da API Hyperliquid"
-        )
+        with col2:
+            base_rpc = st.text_input(
+                "Base RPC URL",
+                value=settings.get("base_rpc_url", "https://mainnet.base.org"),
+                help="URL do RPC da rede Base"
+            )
         
-        hyperliquid_api_key = st.text_input(
-            "API Key",
-            value=settings.get("hyperliquid_api_key", ""),
-            help="API Key da Hyperliquid (necessária para execução)",
-            type="password"
-        )
-    
-    with col2:
-        hyperliquid_wallet = st.text_input(
-            "Wallet Address",
-            value=settings.get("hyperliquid_wallet_address", ""),
-            help="Endereço da wallet na Hyperliquid"
-        )
+        st.markdown("---")
         
-        hyperliquid_api_secret = st.text_input(
-            "API Secret",
-            value=settings.get("hyperliquid_api_secret", ""),
-            help="API Secret da Hyperliquid (necessária para execução)",
-            type="password"
-        )
-    
-    st.markdown("---")
+        # Aerodrome
+        st.markdown("### 🌊 Aerodrome (Base L2)")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            aerodrome_subgraph = st.text_input(
+                "Subgraph URL",
+                value=settings.get("aerodrome_subgraph_url", ""),
+                help="URL do subgraph da Aerodrome"
+            )
+            
+            aerodrome_pool = st.text_input(
+                "Pool Address",
+                value=settings.get("aerodrome_pool_address", ""),
+                help="Endereço do pool ETH/BTC na Aerodrome"
+            )
+        
+        with col2:
+            aerodrome_router = st.text_input(
+                "Router Address",
+                value=settings.get("aerodrome_router", ""),
+                help="Endereço do router da Aerodrome"
+            )
+        
+        st.markdown("---")
+        
+        # Hyperliquid
+        st.markdown("### ⚡ Hyperliquid")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            hyperliquid_base_url = st.text_input(
+                "Base URL",
+                value=settings.get("hyperliquid_base_url", "https://api.hyperliquid.xyz"),
+                help="URL base da API Hyperliquid"
+            )
+            
+            hyperliquid_api_key = st.text_input(
+                "API Key",
+                value=settings.get("hyperliquid_api_key", ""),
+                help="API Key da Hyperliquid (necessária para execução)",
+                type="password"
+            )
+        
+        with col2:
+            hyperliquid_wallet = st.text_input(
+                "Wallet Address",
+                value=settings.get("hyperliquid_wallet_address", ""),
+                help="Endereço da wallet na Hyperliquid"
+            )
+            
+            hyperliquid_api_secret = st.text_input(
+                "API Secret",
+                value=settings.get("hyperliquid_api_secret", ""),
+                help="API Secret da Hyperliquid (necessária para execução)",
+                type="password"
+            )
+        
+        st.markdown("---")
+        
+        submitted = st.form_submit_button("💾 Salvar Credenciais", type="primary", use_container_width=True)
     
-    # Botão de salvar
-    if st.button("💾 Salvar Credenciais", type="primary", use_container_width=True):
+    if submitted:
         new_settings = settings.copy()
         new_settings.update({
             "wallet_public_address": wallet_public,
@@ -204,90 +209,88 @@ def render_strategy_section(settings: Dict[str, Any], manager: SettingsManager):
     """Renderiza seção de estratégia"""
     st.subheader("Parâmetros da Estratégia")
     
-    st.markdown("### 🎯 Triggers de Rebalanceamento")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        recenter_trigger = st.number_input(
-            "Trigger de Recentralização (%)",
-            min_value=0.1,
-            max_value=10.0,
-            value=float(settings.get("recenter_trigger_pct", 1.0)),
-            step=0.1,
-            help="Desvio percentual que dispara rebalanceamento"
-        )
-    
-    with col2:
-        recenter_hysteresis = st.number_input(
-            "Histerese (%)",
-            min_value=0.0,
-            max_value=5.0,
-            value=float(settings.get("recenter_hysteresis_pct", 0.2)),
-            step=0.1,
-            help="Margem de segurança para evitar overtrading"
-        )
-    
-    st.markdown("---")
-    
-    st.markdown("### 📊 Alocação Target (Buffers)")
-    
-    st.info("💡 A soma das alocações deve ser exatamente 100%")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        target_lp = st.number_input(
-            "LP Position (%)",
-            min_value=0.0,
-            max_value=100.0,
-            value=float(settings.get("target_lp_pct", 74.0)),
-            step=1.0,
-            help="Percentual alocado em LP na Aerodrome"
-        )
-    
-    with col2:
-        target_short = st.number_input(
-            "Short Position (%)",
-            min_value=0.0,
-            max_value=100.0,
-            value=float(settings.get("target_short_pct", 24.0)),
-            step=1.0,
-            help="Percentual alocado em shorts na Hyperliquid"
-        )
-    
-    with col3:
-        target_eth_gas = st.number_input(
-            "ETH Gas (%)",
-            min_value=0.0,
-            max_value=100.0,
-            value=float(settings.get("target_eth_gas_pct", 1.0)),
-            step=0.1,
-            help="Reserva de ETH para gas fees"
-        )
-    
-    with col4:
-        target_usdc_cex = st.number_input(
-            "USDC CEX (%)",
-            min_value=0.0,
-            max_value=100.0,
-            value=float(settings.get("target_usdc_cex_pct", 1.0)),
-            step=0.1,
-            help="Reserva de USDC na CEX"
-        )
-    
-    # Validar soma
-    total_allocation = target_lp + target_short + target_eth_gas + target_usdc_cex
-    
-    if abs(total_allocation - 100.0) > 0.01:
-        st.error(f"⚠️ Soma das alocações: {total_allocation:.2f}% (deve ser 100%)")
-    else:
-        st.success(f"✅ Soma das alocações: {total_allocation:.2f}%")
-    
-    st.markdown("---")
+    # Campos agrupados em um form: editar não dispara rerun até salvar
+    with st.form("settings_strategy"):
+        st.markdown("### 🎯 Triggers de Rebalanceamento")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            recenter_trigger = st.number_input(
+                "Trigger de Recentralização (%)",
+                min_value=0.1,
+                max_value=10.0,
+                value=float(settings.get("recenter_trigger_pct", 1.0)),
+                step=0.1,
+                help="Desvio percentual que dispara rebalanceamento"
+            )
+        
+        with col2:
+            recenter_hysteresis = st.number_input(
+                "Histerese (%)",
+                min_value=0.0,
+                max_value=5.0,
+                value=float(settings.get("recenter_hysteresis_pct", 0.2)),
+                step=0.1,
+                help="Margem de segurança para evitar overtrading"
+            )
+        
+        st.markdown("---")
+        
+        st.markdown("### 📊 Alocação Target (Buffers)")
+        
+        st.info("💡 A soma das alocações deve ser exatamente 100%")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            target_lp = st.number_input(
+                "LP Position (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=float(settings.get("target_lp_pct", 74.0)),
+                step=1.0,
+                help="Percentual alocado em LP na Aerodrome"
+            )
+        
+        with col2:
+            target_short = st.number_input(
+                "Short Position (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=float(settings.get("target_short_pct", 24.0)),
+                step=1.0,
+                help="Percentual alocado em shorts na Hyperliquid"
+            )
+        
+        with col3:
+            target_eth_gas = st.number_input(
+                "ETH Gas (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=float(settings.get("target_eth_gas_pct", 1.0)),
+                step=0.1,
+                help="Reserva de ETH para gas fees"
+            )
+        
+        with col4:
+            target_usdc_cex = st.number_input(
+                "USDC CEX (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=float(settings.get("target_usdc_cex_pct", 1.0)),
+                step=0.1,
+                help="Reserva de USDC na CEX"
+            )
+        
+        # Dentro do form os valores só chegam ao salvar; a soma é validada ali
+        st.caption("A soma das alocações deve ser 100% (verificada ao salvar).")
+        
+        st.markdown("---")
+        
+        submitted = st.form_submit_button("💾 Salvar Parâmetros de Estratégia", type="primary", use_container_width=True)
     
-    # Botão de salvar
-    if st.button("💾 Salvar Parâmetros de Estratégia", type="primary", use_container_width=True):
+    if submitted:
         new_settings = settings.copy()
         new_settings.update({
             "recenter_trigger_pct": recenter_trigger,
@@ -315,41 +318,44 @@ def render_risk_section(settings: Dict[str, Any], manager: SettingsManager):
     """Renderiza seção de gestão de risco"""
     st.subheader("Gestão de Risco")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        max_slippage = st.number_input(
-            "Slippage Máximo (%)",
-            min_value=0.1,
-            max_value=10.0,
-            value=float(settings.get("max_slippage_pct", 0.5)),
-            step=0.1,
-            help="Slippage máximo aceito em operações"
-        )
+    # Campos agrupados em um form: editar não dispara rerun até salvar
+    with st.form("settings_risk"):
+        col1, col2 = st.columns(2)
         
-        min_eth_gas = st.number_input(
-            "Saldo Mínimo ETH Gas",
-            min_value=0.1,
-            max_value=10.0,
-            value=float(settings.get("min_eth_gas_balance", 0.5)),
-            step=0.1,
-            help="Saldo mínimo de ETH para gas fees"
-        )
-    
-    with col2:
-        min_usdc_cex = st.number_input(
-            "Saldo Mínimo USDC CEX",
-            min_value=100.0,
-            max_value=50000.0,
-            value=float(settings.get("min_usdc_cex_balance", 5000.0)),
-            step=100.0,
-            help="Saldo mínimo de USDC na CEX"
-        )
-    
-    st.markdown("---")
+        with col1:
+            max_slippage = st.number_input(
+                "Slippage Máximo (%)",
+                min_value=0.1,
+                max_value=10.0,
+                value=float(settings.get("max_slippage_pct", 0.5)),
+                step=0.1,
+                help="Slippage máximo aceito em operações"
+            )
+            
+            min_eth_gas = st.number_input(
+                "Saldo Mínimo ETH Gas",
+                min_value=0.1,
+                max_value=10.0,
+                value=float(settings.get("min_eth_gas_balance", 0.5)),
+                step=0.1,
+                help="Saldo mínimo de ETH para gas fees"
+            )
+        
+        with col2:
+            min_usdc_cex = st.number_input(
+                "Saldo Mínimo USDC CEX",
+                min_value=100.0,
+                max_value=50000.0,
+                value=float(settings.get("min_usdc_cex_balance", 5000.0)),
+                step=100.0,
+                help="Saldo mínimo de USDC na CEX"
+            )
+        
+        st.markdown("---")
+        
+        submitted = st.form_submit_button("💾 Salvar Configurações de Risco", type="primary", use_container_width=True)
     
-    # Botão de salvar
-    if st.button("💾 Salvar Configurações de Risco", type="primary", use_container_width=True):
+    if submitted:
         new_settings = settings.copy()
         new_settings.update({
             "max_slippage_pct": max_slippage,
@@ -370,13 +376,8 @@ def render_execution_section(settings: Dict[str, Any], manager: SettingsManager)
     
     st.info("💡 **MANUAL:** Você aprova cada operação | **AUTO:** Sistema executa automaticamente")
     
-    execution_mode = st.radio(
-        "Modo de Execução",
-        options=["MANUAL", "AUTO"],
-        index=0 if settings.get("execution_mode", "MANUAL") == "MANUAL" else 1,
-        help="Escolha entre execução manual ou automática"
-    )
-    
+    # Fora do form para que o aviso acompanhe o checkbox em tempo real;
+    # o valor é salvo junto com o form
     auto_execute = st.checkbox(
         "Habilitar Execução Automática",
         value=settings.get("auto_execute_enabled", False),
@@ -386,10 +387,20 @@ def render_execution_section(settings: Dict[str, Any], manager: SettingsManager)
     if auto_execute:
         st.warning("⚠️ **ATENÇÃO:** Execução automática habilitada! Sistema executará operações sem confirmação.")
     
-    st.markdown("---")
+    # Campos agrupados em um form: editar não dispara rerun até salvar
+    with st.form("settings_execution"):
+        execution_mode = st.radio(
+            "Modo de Execução",
+            options=["MANUAL", "AUTO"],
+            index=0 if settings.get("execution_mode", "MANUAL") == "MANUAL" else 1,
+            help="Escolha entre execução manual ou automática"
+        )
+        
+        st.markdown("---")
+        
+        submitted = st.form_submit_button("💾 Salvar Configurações de Execução", type="primary", use_container_width=True)
     
-    # Botão de salvar
-    if st.button("💾 Salvar Configurações de Execução", type="primary", use_container_width=True):
+    if submitted:
         new_settings = settings.copy()
         new_settings.update({
             "execution_mode": execution_mode,
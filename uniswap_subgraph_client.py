@@ -13,6 +13,7 @@ Usage:
 """
 
 import requests
+from collections import defaultdict
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
@@ -206,7 +207,7 @@ class UniswapSubgraphClient:
         """
         positions = self.get_lp_positions(wallet_address)
         
-        balances = {}
+        balances = defaultdict(float)
         
         for pos in positions:
             # Normalize symbols
@@ -218,10 +219,10 @@ class UniswapSubgraphClient:
             token1_amount = pos.token1_balance / (10 ** pos.token1_decimals)
             
             # Aggregate balances
-            balances[token0] = balances.get(token0, 0) + token0_amount
-            balances[token1] = balances.get(token1, 0) + token1_amount
+            balances[token0] += token0_amount
+            balances[token1] += token1_amount
         
-        return balances
+        return dict(balances)
     
     def get_pool_info(self, pool_address: str) -> Dict:
         """